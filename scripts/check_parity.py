@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Same seed = same data, whichever optional extras are installed.
+
+Checks that the optional fast paths produce exactly what the plain
+NumPy/pandas paths produce:
+- orjson vs stdlib encoding in write_json_each_row (byte-equal output,
+  raw and 15m-aggregated rows, ts formatted as the emit scripts do, plus
+  float edge values and the neighbours of each float text-format bound)
+- pyarrow vs pandas to_csv in write_raw_minute_csv (byte-equal files,
+  raw and 15m-aggregated rows plus float edge values)
+
+Also asserts the guarantees documented on generate_minute_logs (status
+buckets sum to requests, status detail sums to its bucket, ATS counts
+sum to requests) plus non-negative counts and p50 <= p95 <= p99, on raw
+and 15m-aggregated rows, with and without heavy overlapping incidents.
+
+Exits non-zero on the first mismatch; a path whose extra is not
+installed is reported as skipped.
+"""
+from __future__ import annotations
+
+import os, sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+import io
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import telemetry_kit.emit.csv as csv_emit
+import telemetry_kit.emit.json_each_row as json_each_row
+from telemetry_kit.emit.csv import write_raw_minute_csv
+from telemetry_kit.emit.json_each_row import write_json_each_row
+from telemetry_kit.generator import ATS_COLUMNS, Incident, aggregate_logs, generate_minute_logs
+from telemetry_kit.schema import AGG_15M_COLUMNS, RAW_MINUTE_COLUMNS
+
+START = datetime(2026, 2, 21, 17, 0, tzinfo=timezone.utc)  # Saturday evening: event overlay active
+MINUTES = 120
+
+INCIDENTS = [
+    Incident("lat", START + timedelta(minutes=5), START + timedelta(minutes=25), "latency", service="live", intensity=1.2),
+    Incident("cc", START + timedelta(minutes=10), START + timedelta(minutes=40), "cache_collapse", content_type="segment"),
+    Incident("oo", START + timedelta(minutes=30), START + timedelta(minutes=60), "origin_overload", region="us-east"),
+    Incident("to", START + timedelta(minutes=45), START + timedelta(minutes=90), "timeouts", partner="partner_02"),
+    Incident("crc", START, START + timedelta(minutes=MINUTES), "crc_spike", pop="pop_003"),
+]
+
+# Every incident kind at once, at high intensity, over the whole window.
+HEAVY_INCIDENTS = [
+    Incident(f"heavy_{kind}", START, START + timedelta(minutes=MINUTES), kind, intensity=3.0)
+    for kind in ("latency", "cache_collapse", "origin_overload", "timeouts", "crc_spike")
+]
+
+# (label, parts, total): parts must sum to total on every row.
+SUM_GUARANTEES = [
+    ("http buckets", ["http_2xx_count", "http_3xx_count", "http_4xx_count", "http_5xx_count"], "requests"),
+    ("2xx detail", ["status_200", "status_206"], "http_2xx_count"),
+    ("3xx detail", ["status_304"], "http_3xx_count"),
+    ("4xx detail", ["status_403", "status_404", "status_429"], "http_4xx_count"),
+    ("5xx detail", ["status_500", "status_502", "status_503", "status_504"], "http_5xx_count"),
+    ("ats counts", list(ATS_COLUMNS), "requests"),
+]
+
+
+def _generate(seed: int, incidents=INCIDENTS) -> pd.DataFrame:
+    return generate_minute_logs(START, MINUTES, seed=seed, incidents=incidents)
+
+
+def _assert_guarantees(df: pd.DataFrame, name: str) -> None:
+    for label, parts, total in SUM_GUARANTEES:
+        bad = int((df[parts].sum(axis=1) != df[total]).sum())
+        if bad:
+            raise AssertionError(f"guarantees: {name}: {label} do not sum to {total} on {bad} rows")
+    negative = [c for c, n in (df.select_dtypes("integer") < 0).sum().items() if n]
+    if negative:
+        raise AssertionError(f"guarantees: {name}: negative counts in {negative}")
+    bad = int(((df["p50_ms"] > df["p95_ms"]) | (df["p95_ms"] > df["p99_ms"])).sum())
+    if bad:
+        raise AssertionError(f"guarantees: {name}: p50 <= p95 <= p99 broken on {bad} rows")
+
+
+def check_guarantees(seeds=(7, 11), agg_minutes: int = 30) -> None:
+    for seed in seeds:
+        for scenario, incidents in (("incidents", INCIDENTS), ("heavy incidents", HEAVY_INCIDENTS)):
+            raw = _generate(seed, incidents)
+            _assert_guarantees(raw, f"seed {seed}, {scenario}, raw")
+            if seed == seeds[0]:
+                # aggregate_logs loops per group in Python; two buckets are enough here.
+                head = raw[raw["ts"] < START + timedelta(minutes=agg_minutes)]
+                _assert_guarantees(aggregate_logs(head, bucket_minutes=15), f"seed {seed}, {scenario}, agg15m")
+    print(f"ok: guarantees ({len(seeds)} seeds x {MINUTES} minutes raw, {agg_minutes} minutes agg15m, with heavy incidents)")
+
+
+def _first_diff_line(a: str, b: str) -> int:
+    a, b = a.split("\n"), b.split("\n")
+    return 1 + next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+
+
+def _json_each_row_text(df: pd.DataFrame) -> str:
+    buf = io.StringIO()
+    write_json_each_row(df, buf)
+    return buf.getvalue()
+
+
+def _float_edge_frame() -> pd.DataFrame:
+    x = np.array([1081.0, 0.1, 1e-5, 1.5e8, 123456789.0, 1e300, 5e-324, -0.0, np.nan, np.inf, -np.inf])
+    with np.errstate(over="ignore"):
+        x32 = x.astype(np.float32)
+    ts = pd.date_range(START, periods=len(x), freq="min")
+    return pd.DataFrame({"ts": ts, "f64": x, "f32": x32, "flag": np.arange(len(x)) % 2 == 0})
+
+
+def _float_bound_frame(steps: int = 3) -> pd.DataFrame:
+    """float32/float64 values a few ulps either side of each text-format bound in json_each_row."""
+    ranges = [*json_each_row._ORJSON_REPR_RANGE.values(), json_each_row._NUMPY_F32_REPR_RANGE]
+    bounds = sorted({b for bound_range in ranges for b in bound_range})
+    cols = {}
+    for dtype in (np.float32, np.float64):
+        values = []
+        for bound in bounds:
+            down = up = dtype(bound)
+            values.append(up)
+            for _ in range(steps):
+                down, up = np.nextafter(down, dtype(0)), np.nextafter(up, dtype(np.inf))
+                values += [down, up]
+        values = np.array(values, dtype=dtype)
+        cols[np.dtype(dtype).name] = np.concatenate([values, -values])
+    return pd.DataFrame(cols)
+
+
+def check_json_parity(seed: int = 7) -> None:
+    dumps = json_each_row.orjson
+    if dumps is None:
+        print("skip: json parity (orjson not installed)")
+        return
+
+    raw = _generate(seed)
+    frames = {
+        "raw": raw.reindex(columns=RAW_MINUTE_COLUMNS),
+        "agg15m": aggregate_logs(raw, bucket_minutes=15).reindex(columns=AGG_15M_COLUMNS),
+        "float edges": _float_edge_frame(),
+        "float bounds": _float_bound_frame(),
+    }
+    for name, df in frames.items():
+        if "ts" in df.columns:
+            df["ts"] = df["ts"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        with_orjson = _json_each_row_text(df)
+        json_each_row.orjson = None
+        try:
+            without_orjson = _json_each_row_text(df)
+        finally:
+            json_each_row.orjson = dumps
+        if with_orjson != without_orjson:
+            line = _first_diff_line(with_orjson, without_orjson)
+            raise AssertionError(f"json parity: {name} rows differ at line {line}")
+    print(f"ok: json parity (raw + agg15m + float edges/bounds, seed {seed} x {MINUTES} minutes)")
+
+
+def check_csv_parity(seed: int = 7) -> None:
+    arrow = csv_emit.pa
+    if arrow is None:
+        print("skip: csv parity (pyarrow not installed)")
+        return
+
+    raw = _generate(seed)
+    frames = {
+        "raw": (raw, RAW_MINUTE_COLUMNS),
+        "agg15m": (aggregate_logs(raw, bucket_minutes=15), AGG_15M_COLUMNS),
+        "float edges": (_float_edge_frame(), None),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (df, columns) in frames.items():
+            columns = columns or tuple(df.columns)
+            with_arrow = write_raw_minute_csv(df, Path(tmp, "arrow.csv"), columns=columns).read_text()
+            csv_emit.pa = None
+            try:
+                without_arrow = write_raw_minute_csv(df, Path(tmp, "pandas.csv"), columns=columns).read_text()
+            finally:
+                csv_emit.pa = arrow
+            if with_arrow != without_arrow:
+                line = _first_diff_line(with_arrow, without_arrow)
+                raise AssertionError(f"csv parity: {name} files differ at line {line}")
+    print(f"ok: csv parity (raw + agg15m + float edges, seed {seed} x {MINUTES} minutes)")
+
+
+def main():
+    check_guarantees()
+    check_json_parity()
+    check_csv_parity()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,12 @@ import os, sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
 import argparse
-import json
 from datetime import datetime, timezone
 
-from telemetry_kit.generator import generate_minute_logs
+import pandas as pd
+
+from telemetry_kit.emit.json_each_row import write_json_each_row
+from telemetry_kit.generator import DIMENSION_COLUMNS, dimension_labels, generate_minute_batches
 from telemetry_kit.schema import RAW_MINUTE_COLUMNS
 
 
@@ -20,6 +22,13 @@ def to_ch_utc_str(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def to_ch_utc_series(ts: pd.Series | datetime) -> pd.Series | str:
+    """Vectorized to_ch_utc_str for a whole column (naive values are taken as UTC)."""
+    if not isinstance(ts, pd.Series):
+        return to_ch_utc_str(ts)
+    return pd.to_datetime(ts, utc=True).dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
 def parse_start(s: str) -> datetime:
     # Accept "2026-02-20T00:00:00Z" or with offset
     s = s.replace("Z", "+00:00")
@@ -40,28 +49,38 @@ def main():
         help="Fixed UTC start for deterministic replay (ISO, e.g. 2026-02-20T00:00:00Z)",
     )
     ap.add_argument("--density", type=float, default=0.10)
+    ap.add_argument("--flush-every", type=int, default=15, help="Flush stdout every N minute batches")
     args = ap.parse_args()
+    if args.flush_every < 1:
+        ap.error("--flush-every must be >= 1")
 
     start_ts = parse_start(args.start)
 
-    df = generate_minute_logs(
-        start_ts_utc=start_ts,
-        minutes=args.minutes,
-        seed=args.seed,
-        density=args.density,
-    )
-
-    if df.empty:
-        return
-
-    # enforce contract order + fix time
-    df = df[RAW_MINUTE_COLUMNS].copy()
-    df["ts"] = df["ts"].apply(to_ch_utc_str)
+    # Batches carry category codes; wrap them with one prebuilt dtype per dimension.
+    dim_dtypes = {col: pd.CategoricalDtype(labels) for col, labels in dimension_labels().items()}
 
-    # JSONEachRow: one JSON per line
+    # Stream one minute batch at a time (VPS-friendly: memory stays flat in --minutes)
     try:
-        for row in df.to_dict(orient="records"):
-            print(json.dumps(row, separators=(",", ":"), ensure_ascii=False))
+        for i, batch in enumerate(
+            generate_minute_batches(
+                start_ts_utc=start_ts,
+                minutes=args.minutes,
+                seed=args.seed,
+                density=args.density,
+            ),
+            start=1,
+        ):
+            # enforce contract order + fix time
+            for col in DIMENSION_COLUMNS:
+                batch[col] = pd.Categorical.from_codes(batch[col], dtype=dim_dtypes[col])
+            df = pd.DataFrame(batch, columns=RAW_MINUTE_COLUMNS)
+            df["ts"] = to_ch_utc_series(df["ts"])
+
+            # JSONEachRow: one JSON per line
+            write_json_each_row(df)
+            if i % args.flush_every == 0:
+                sys.stdout.flush()
+        sys.stdout.flush()
     except BrokenPipeError:
         # When piping to `head`, stdout closes early — exit quietly.
         sys.exit(0)
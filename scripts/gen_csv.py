@@ -1,38 +1,105 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 
+import pandas as pd
+
 from telemetry_kit.generator import generate_minute_logs
+from telemetry_kit.emit.arrow import write_raw_minute_feather, write_raw_minute_parquet
 from telemetry_kit.emit.csv import write_raw_minute_csv
+from telemetry_kit.schema import AGG_15M_BUCKET_MINUTES
+
+WRITERS = {
+    "csv": write_raw_minute_csv,
+    "parquet": write_raw_minute_parquet,
+    "feather": write_raw_minute_feather,
+}
+
+
+def _shards(start: datetime, minutes: int, workers: int) -> list[tuple[int, int]]:
+    """
+    Split [0, minutes) into at most `workers` contiguous (offset, length) ranges.
+    Inner cut points fall on AGG_15M_BUCKET_MINUTES wall-clock boundaries, so no
+    aggregation bucket straddles two shards.
+    """
+    bucket = AGG_15M_BUCKET_MINUTES
+    lead = -(int(start.timestamp()) // 60) % bucket  # minutes until the first bucket boundary
+    cuts = {0, minutes}
+    for i in range(1, workers):
+        cut = lead + round((minutes * i / workers - lead) / bucket) * bucket
+        if 0 < cut < minutes:
+            cuts.add(cut)
+    cuts = sorted(cuts)
+    return [(lo, hi - lo) for lo, hi in zip(cuts, cuts[1:])]
 
 
 def main() -> None:
-    ap = argparse.ArgumentParser(description="Generate synthetic CDN telemetry CSV (raw_minute).")
-    ap.add_argument("--out", required=True, help="Output CSV path (e.g. /tmp/telemetry.csv)")
+    ap = argparse.ArgumentParser(description="Generate synthetic CDN telemetry (raw_minute) as CSV/Parquet/Feather.")
+    ap.add_argument("--out", required=True, help="Output path (e.g. /tmp/telemetry.csv, /tmp/telemetry.csv.zst)")
+    ap.add_argument(
+        "--format",
+        choices=sorted(WRITERS),
+        default="csv",
+        help="Output format (csv compression follows the --out suffix; parquet/feather use zstd)",
+    )
     ap.add_argument("--minutes", type=int, default=360, help="Minutes to generate")
     ap.add_argument("--seed", type=int, default=7, help="Random seed for reproducibility")
     ap.add_argument("--density", type=float, default=0.10, help="Slice sampling density (0-1)")
     ap.add_argument("--partners", type=int, default=6)
     ap.add_argument("--pops", type=int, default=20)
     ap.add_argument("--hosts", type=int, default=120)
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Generate 15-minute-aligned minute ranges in this many processes. Shard i draws "
+            "with seed*workers+i over the slice pool of --seed; the seed column holds --seed"
+        ),
+    )
     args = ap.parse_args()
 
     now = datetime.now(timezone.utc)
     start = (now - timedelta(minutes=args.minutes)).replace(second=0, microsecond=0)
 
-    df = generate_minute_logs(
-        start_ts_utc=start,
-        minutes=args.minutes,
+    gen_kwargs = dict(
         n_partners=args.partners,
         n_pops=args.pops,
         n_hosts=args.hosts,
-        seed=args.seed,
         density=args.density,
         incidents=[],  # keep empty by default
     )
 
-    out = write_raw_minute_csv(df, args.out)
+    workers = max(1, args.workers)
+    if workers == 1:
+        df = generate_minute_logs(start_ts_utc=start, minutes=args.minutes, seed=args.seed, **gen_kwargs)
+    else:
+        # Worker mode: shard i runs its own RNG stream (seed * workers + i) over the
+        # slice pool drawn from --seed, so slice identities continue across shards.
+        # Output is reproducible for a given (--seed, --workers) pair. The seed column
+        # records --seed (the run), not the per-shard stream. Service state timelines
+        # restart (healthy) at each shard boundary.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    generate_minute_logs,
+                    start_ts_utc=start + timedelta(minutes=offset),
+                    minutes=length,
+                    seed=args.seed * workers + i,
+                    pool_seed=args.seed,
+                    **gen_kwargs,
+                )
+                for i, (offset, length) in enumerate(_shards(start, args.minutes, workers))
+            ]
+            parts = [f.result() for f in futures]
+        parts = [p for p in parts if not p.empty]
+        for part in parts:
+            part["seed"] = args.seed
+        df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+    out = WRITERS[args.format](df, args.out)
     print(f"Wrote {len(df):,} rows -> {out}")
 
 
@@ -1 +1 @@
-__all__ = ["csv"]
+__all__ = ["arrow", "csv", "json_each_row"]
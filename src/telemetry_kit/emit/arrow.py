@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+try:  # optional: pip install "cdn-telemetry-kit[arrow]"
+    import pyarrow as pa
+    import pyarrow.feather as pafeather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    pafeather = None
+    pq = None
+
+from ..schema import RAW_MINUTE_COLUMNS
+
+
+def _raw_minute_table(df: pd.DataFrame, columns: Optional[Iterable[str]]) -> "pa.Table":
+    """
+    Arrow table with stable column order (missing columns as null).
+    ts stays a native UTC timestamp; categorical slice dimensions become
+    dictionary-encoded columns.
+    """
+    if pa is None:
+        raise ImportError('Parquet/Feather output requires pyarrow: pip install "cdn-telemetry-kit[arrow]"')
+
+    cols = tuple(columns) if columns is not None else RAW_MINUTE_COLUMNS
+    df_out = df.reindex(columns=cols)
+    return pa.Table.from_pandas(df_out, preserve_index=False)
+
+
+def write_raw_minute_parquet(
+    df: pd.DataFrame,
+    out_path: str | Path,
+    columns: Optional[Iterable[str]] = None,
+    compression: Optional[str] = "zstd",
+) -> Path:
+    """
+    Write raw_minute telemetry to Parquet with stable column order.
+    - Dictionary-encodes repeated values (partner/pop/host/...)
+    - zstd-compressed by default
+    """
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    table = _raw_minute_table(df, columns)
+    pq.write_table(table, out, compression=compression, use_dictionary=True)
+    return out
+
+
+def write_raw_minute_feather(
+    df: pd.DataFrame,
+    out_path: str | Path,
+    columns: Optional[Iterable[str]] = None,
+    compression: Optional[str] = "zstd",
+) -> Path:
+    """
+    Write raw_minute telemetry to Feather (Arrow IPC) with stable column order.
+    - zstd-compressed by default
+    """
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    table = _raw_minute_table(df, columns)
+    pafeather.write_feather(table, out, compression=compression or "uncompressed")
+    return out
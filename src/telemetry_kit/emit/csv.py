@@ -3,37 +3,142 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
+try:  # optional: pip install "cdn-telemetry-kit[arrow]"
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    pc = None
+    pacsv = None
+
 from ..schema import RAW_MINUTE_COLUMNS
 
+# Suffix -> codec for compression="infer" (same suffixes pandas recognizes).
+_SUFFIX_COMPRESSION = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+    ".xz": "xz",
+    ".zip": "zip",
+}
+
+# Codecs pyarrow can stream through CompressedOutputStream.
+_ARROW_CODECS = {"gzip", "bz2", "zstd"}
+
+_TS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _is_utc_datetime(dtype) -> bool:
+    """Naive datetime64 (taken as UTC) or tz-aware UTC: formattable as-is."""
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return str(dtype.tz) == "UTC"
+    return pd.api.types.is_datetime64_dtype(dtype)
+
+
+def _resolve_compression(out: Path, compression: Optional[str]) -> Optional[str]:
+    if compression == "infer":
+        return _SUFFIX_COMPRESSION.get(out.suffix.lower())
+    return compression
+
+
+def _csv_text(values: np.ndarray) -> np.ndarray:
+    """Floats/bools as to_csv renders them: str() of each value, NaN as an empty field."""
+    text = values.astype(str).astype(object)
+    if values.dtype.kind == "f":
+        text[np.isnan(values)] = None
+    return text
+
+
+def _arrow_text_matches(type_: "pa.DataType") -> bool:
+    """Arrow types whose CSV text is the same as to_csv's."""
+    if pa.types.is_dictionary(type_):
+        type_ = type_.value_type
+    return pa.types.is_integer(type_) or pa.types.is_string(type_) or pa.types.is_large_string(type_)
+
+
+def _write_csv_arrow(df_out: pd.DataFrame, out: Path, compression: Optional[str]) -> bool:
+    """
+    Write df_out with pyarrow's C++ CSV writer.
+    Returns False when a value would need quoting, a column has no
+    to_csv-identical rendering in Arrow, or the codec is not streamable by
+    Arrow, so the caller can fall back to pandas and keep the output
+    byte-identical to to_csv.
+    """
+    if compression is not None and compression not in _ARROW_CODECS:
+        return False
+
+    try:
+        table = pa.Table.from_pandas(df_out, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return False
+    for i, name in enumerate(table.column_names):
+        if name == "ts":
+            # Format ts inside Arrow: naive is taken as UTC, aware is converted to UTC,
+            # sub-second precision is truncated (same text as pandas' dt.strftime).
+            ts = table.column(i)
+            if not pa.types.is_timestamp(ts.type):
+                ts = pa.chunked_array([pa.array(pd.to_datetime(df_out["ts"], utc=True))])
+            ts = pc.cast(ts, pa.timestamp("s", tz="UTC"), safe=False)
+            table = table.set_column(i, "ts", pc.strftime(ts, format=_TS_FORMAT))
+            continue
+        dtype = df_out.dtypes.iloc[i]
+        if isinstance(dtype, np.dtype) and dtype.kind in "fb":
+            # Arrow prints 1081 / 0.00001 / true where pandas prints 1081.0 / 1e-05 / True.
+            text = _csv_text(df_out.iloc[:, i].to_numpy())
+            table = table.set_column(i, name, pa.array(text, type=pa.string()))
+        elif not _arrow_text_matches(table.column(i).type):
+            return False
+    sink = pa.CompressedOutputStream(str(out), compression) if compression else out.open("wb")
+    try:
+        with sink as fh:
+            # Arrow always quotes header names; write the plain header ourselves.
+            fh.write((",".join(df_out.columns) + "\n").encode("utf-8"))
+            pacsv.write_csv(
+                table,
+                fh,
+                write_options=pacsv.WriteOptions(include_header=False, quoting_style="none"),
+            )
+    except pa.ArrowInvalid:
+        return False
+    return True
+
 
 def write_raw_minute_csv(
     df: pd.DataFrame,
     out_path: str | Path,
     columns: Optional[Iterable[str]] = None,
+    compression: Optional[str] = "infer",
 ) -> Path:
     """
     Write raw_minute telemetry to CSV with stable column order.
-    - Ensures columns exist (adds missing as null)
+    - Ensures columns exist (adds missing as null, without touching df)
     - Formats ts as ISO UTC string
+    - Compresses by suffix by default (.gz / .bz2 / .zst / .xz / .zip),
+      or with an explicit codec such as compression="zstd"
+    - Uses pyarrow's CSV writer when installed, pandas to_csv otherwise
     """
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
+    codec = _resolve_compression(out, compression)
 
-    cols = list(columns) if columns is not None else RAW_MINUTE_COLUMNS
-
-    # Add any missing columns as nulls
-    for c in cols:
-        if c not in df.columns:
-            df[c] = None
+    cols = tuple(columns) if columns is not None else RAW_MINUTE_COLUMNS
 
-    # Stable ordering
-    df_out = df[list(cols)].copy()
+    # Stable ordering; missing columns come back as nulls. The caller's frame
+    # is never modified, and is used as-is when its columns already match
+    # (reindex only runs when a differently shaped frame is needed anyway).
+    df_out = df if tuple(df.columns) == cols else df.reindex(columns=cols)
 
-    # Format timestamp
-    if "ts" in df_out.columns:
-        df_out["ts"] = pd.to_datetime(df_out["ts"], utc=True).dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # ts is formatted by the writers (Arrow strftime / to_csv date_format), so the
+    # frame is never rebuilt just to hold a string copy of it.
+    if pa is not None and _write_csv_arrow(df_out, out, codec):
+        return out
 
-    df_out.to_csv(out, index=False)
+    if "ts" in df_out.columns and not _is_utc_datetime(df_out["ts"].dtype):
+        # Strings or non-UTC timestamps: normalize to UTC first (the only path that copies).
+        df_out = df_out.assign(ts=pd.to_datetime(df_out["ts"], utc=True))
+    df_out.to_csv(out, index=False, compression=codec, date_format=_TS_FORMAT)
     return out
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import List, Optional, TextIO
+
+import numpy as np
+import pandas as pd
+
+try:  # optional: pip install "cdn-telemetry-kit[json]"
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# Magnitudes for which orjson prints finite floats exactly as repr() does
+# (positional, same shortest digits); outside them the repr rule is applied directly.
+# Bounds are compared in the value's own dtype: float32(1e13) is 9999999827968.0,
+# yet its shortest repr is 1e13, which orjson prints in exponent form.
+_ORJSON_REPR_RANGE = {np.dtype(np.float32): (1e-3, 1e13), np.dtype(np.float64): (1e-3, 1e15)}
+
+# Same for NumPy's float32 str(), which switches to exponent form much earlier.
+_NUMPY_F32_REPR_RANGE = (1e-3, 1e6)
+
+
+def _outside(values: np.ndarray, bounds: tuple) -> np.ndarray:
+    """Finite, non-zero values with magnitude outside [lo, hi), in the values' dtype."""
+    lo, hi = (values.dtype.type(b) for b in bounds)
+    mag = np.abs(values)
+    return np.isfinite(mag) & (mag != 0) & ((mag < lo) | (mag >= hi))
+
+
+def _float_repr_text(values: np.ndarray) -> List[str]:
+    """repr() of each value; float32 via its shortest float32 digits (0.1f -> 0.1)."""
+    if values.dtype != np.float32:
+        return list(map(repr, values.tolist()))
+
+    text = values.astype(str).tolist()
+    for i in np.flatnonzero(_outside(values, _NUMPY_F32_REPR_RANGE)).tolist():
+        text[i] = repr(float(text[i]))
+    return text
+
+
+def _float_text(values: np.ndarray) -> List[str]:
+    """
+    Float column as JSON text, byte-identical with and without orjson:
+    repr() of the value (float32 keeps its shortest repr), NaN/inf -> null.
+    orjson only speeds up the common range where its output already matches.
+    """
+    if orjson is not None:
+        text = orjson.dumps(values, option=orjson.OPT_SERIALIZE_NUMPY).decode()[1:-1].split(",")
+        redo = np.flatnonzero(_outside(values, _ORJSON_REPR_RANGE[values.dtype]))
+        for i, s in zip(redo.tolist(), _float_repr_text(values[redo])):
+            text[i] = s
+        return text
+
+    text = _float_repr_text(values)
+    for i in np.flatnonzero(~np.isfinite(values)).tolist():
+        text[i] = "null"
+    return text
+
+
+def _int_text(values: np.ndarray) -> List[str]:
+    if orjson is not None:
+        return orjson.dumps(values, option=orjson.OPT_SERIALIZE_NUMPY).decode()[1:-1].split(",")
+    return list(map(str, values.tolist()))
+
+
+def _label_text(labels: list, codes: np.ndarray) -> Optional[List[str]]:
+    """Encode each distinct string once (stdlib json), gather by code; -1 -> null."""
+    if not all(isinstance(label, str) for label in labels):
+        return None
+    encoded = np.array([json.dumps(label, ensure_ascii=False) for label in labels] + ["null"], dtype=object)
+    return encoded[codes].tolist()
+
+
+def _encode_column(col: pd.Series) -> Optional[List[str]]:
+    """
+    Column as a list of JSON value strings, or None when it is not one of
+    the dtypes encoded here (the caller then falls back to to_json). The
+    choice never depends on whether orjson is installed.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return _label_text(col.cat.categories.tolist(), col.cat.codes.to_numpy())
+
+    values = col.to_numpy()
+    if values.dtype in (np.float32, np.float64):
+        return _float_text(np.ascontiguousarray(values))
+    if values.dtype.kind in "iu":
+        return _int_text(np.ascontiguousarray(values))
+    if values.dtype.kind == "b":
+        return ["true" if v else "false" for v in values.tolist()]
+    if values.dtype.kind == "O" or pd.api.types.is_string_dtype(col.dtype):
+        codes, uniques = pd.factorize(col)
+        return _label_text(list(uniques), codes)
+    return None
+
+
+def _stitched_payload(df: pd.DataFrame) -> Optional[str]:
+    """
+    JSONEachRow encoded column by column, then stitched into rows with a
+    single %-template. Returns None to fall back to to_json.
+    """
+    if df.columns.has_duplicates:
+        return None
+
+    values = [_encode_column(df[c]) for c in df.columns]
+    if any(v is None for v in values):
+        return None
+
+    keys = [json.dumps(str(c), ensure_ascii=False).replace("%", "%%") for c in df.columns]
+    template = "{" + ",".join(f"{k}:%s" for k in keys) + "}\n"
+    return "".join([template % row for row in zip(*values)])
+
+
+def write_json_each_row(df: pd.DataFrame, out: Optional[TextIO] = None) -> None:
+    """
+    Write rows as ClickHouse JSONEachRow (one JSON object per line).
+    - Encodes column by column (no per-row dicts / json.dumps); numeric
+      columns go through orjson when installed, with identical output
+    - Floats print as repr() (float32 as its shortest repr); NaN/inf -> null
+    - Falls back to pandas' to_json for other dtypes (e.g. datetimes)
+    - Writes nothing for an empty frame
+    """
+    if not len(df):
+        return
+
+    out = out if out is not None else sys.stdout
+    payload = _stitched_payload(df)
+    if payload is None:
+        payload = df.to_json(orient="records", lines=True, force_ascii=False, double_precision=15)
+    # Older pandas omits the trailing newline after the last record.
+    out.write(payload if payload.endswith("\n") else payload + "\n")
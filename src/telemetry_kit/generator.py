@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Tuple
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List
 
 import numpy as np
 import pandas as pd
@@ -13,6 +12,17 @@ from .schema import (
     DEFAULT_REGIONS,
     DEFAULT_CONTENT_TYPES,
     DEFAULT_UA_FAMILIES,
+    CONTENT_TYPE_3XX_MULT,
+    CONTENT_TYPE_4XX_MULT,
+    CONTENT_TYPE_AVG_BYTES,
+    CONTENT_TYPE_BASE_CACHE_HIT,
+    CONTENT_TYPE_BASE_P50_MS,
+    CONTENT_TYPE_EVENT_SENSITIVITY,
+    CONTENT_TYPE_RPS_MULT,
+    SERVICE_4XX_MULT,
+    SERVICE_BASE_RPS,
+    SERVICE_EVENT_SENSITIVITY,
+    SERVICE_P50_ADD_MS,
 )
 
 
@@ -37,6 +47,79 @@ ATS_COLUMNS = [
     "ats_err_unknown_count",
 ]
 
+# ATS result codes grouped into the families used by the correlation helpers.
+ATS_FAMILIES = {
+    "hit_family": ["ats_tcp_hit_count", "ats_tcp_cf_hit_count"],
+    "miss_family": [
+        "ats_tcp_miss_count",
+        "ats_tcp_refresh_miss_count",
+        "ats_tcp_ref_fail_hit_count",
+    ],
+    "refresh_ims": [
+        "ats_tcp_refresh_hit_count",
+        "ats_tcp_client_refresh_count",
+        "ats_tcp_ims_hit_count",
+        "ats_tcp_ims_miss_count",
+    ],
+    "client_issues": ["ats_err_client_abort_count", "ats_err_client_read_error_count"],
+    "infra": [
+        "ats_err_connect_fail_count",
+        "ats_err_dns_fail_count",
+        "ats_err_read_timeout_count",
+    ],
+    "rare": [
+        "ats_tcp_swapfail_count",
+        "ats_err_invalid_req_count",
+        "ats_err_proxy_denied_count",
+        "ats_err_unknown_count",
+    ],
+}
+_ATS_FAMILY_INDEX = {
+    family: [ATS_COLUMNS.index(col) for col in cols] for family, cols in ATS_FAMILIES.items()
+}
+
+# Slice dimensions: category codes while generating, pd.Categorical in the output.
+DIMENSION_COLUMNS = [
+    "partner",
+    "service",
+    "region",
+    "pop",
+    "host",
+    "content_type",
+    "ua_family",
+]
+
+# Output dtypes for generated metric columns (buffers are preallocated with these).
+# Per-minute-per-slice counts fit int32 and latencies/rates need no more than float32;
+# bytes_sent stays int64 (a busy slice-minute can exceed 2**31 bytes).
+METRIC_DTYPES = {
+    "requests": np.int32,
+    "bytes_sent": np.int64,
+    "p50_ms": np.float32,
+    "p95_ms": np.float32,
+    "p99_ms": np.float32,
+    "cache_hit_rate": np.float32,
+    "http_2xx_count": np.int32,
+    "http_3xx_count": np.int32,
+    "http_4xx_count": np.int32,
+    "http_5xx_count": np.int32,
+    "status_200": np.int32,
+    "status_206": np.int32,
+    "status_304": np.int32,
+    "status_403": np.int32,
+    "status_404": np.int32,
+    "status_429": np.int32,
+    "status_500": np.int32,
+    "status_502": np.int32,
+    "status_503": np.int32,
+    "status_504": np.int32,
+    "crc_errors": np.int32,
+}
+ATS_DTYPE = np.int32
+
+# Fixed slice pool per generator run; each minute samples density * pool of it (at least 50).
+SLICE_POOL_SIZE = 5000
+
 
 # -----------------------------
 # Incident model
@@ -83,12 +166,100 @@ def _utc_bucket_floor(dt: datetime, bucket_minutes: int) -> datetime:
     return dt.replace(minute=m)
 
 
+def _slices_per_minute(density: float) -> int:
+    return max(50, int(SLICE_POOL_SIZE * density))
+
+
 def _clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
-def _matches(val: str, expected: str | None) -> bool:
-    return True if expected is None else (val == expected)
+def _code_dtype(n_labels: int) -> type:
+    """Category-code dtype for a dimension: int16 when it fits, int32 for larger label sets."""
+    return np.int16 if n_labels <= np.iinfo(np.int16).max + 1 else np.int32
+
+
+def dimension_labels(
+    n_partners: int = 6,
+    n_pops: int = 20,
+    n_hosts: int = 120,
+    services: List[str] | None = None,
+    regions: List[str] | None = None,
+    content_types: List[str] | None = None,
+    ua_families: List[str] | None = None,
+) -> Dict[str, List[str]]:
+    """
+    Configured labels per slice dimension (category code i = labels[i]).
+    Takes the generator's dimension parameters, with the same defaults.
+    """
+    return {
+        "partner": [f"partner_{i:02d}" for i in range(1, n_partners + 1)],
+        "service": services or DEFAULT_SERVICES,
+        "region": regions or DEFAULT_REGIONS,
+        "pop": [f"pop_{i:03d}" for i in range(1, n_pops + 1)],
+        "host": [f"host_{i:04d}" for i in range(1, n_hosts + 1)],
+        "content_type": content_types or DEFAULT_CONTENT_TYPES,
+        "ua_family": ua_families or DEFAULT_UA_FAMILIES,
+    }
+
+
+def _filter_code(labels: List[str], expected: str | None) -> int:
+    """Category code an incident filter matches: -1 = any, -2 = label not configured."""
+    if expected is None:
+        return -1
+    return labels.index(expected) if expected in labels else -2
+
+
+def _lookup_array(labels: List[str], canonical: List[str], values: np.ndarray, default: float) -> np.ndarray:
+    """
+    Per-label lookup table indexed by category code, from a schema table
+    aligned with `canonical`. The default label set uses it as-is; custom
+    labels are matched by name and unknown labels get `default`.
+    """
+    if list(labels) == list(canonical):
+        return values
+    table = dict(zip(canonical, values.tolist()))
+    return np.array([table.get(label, default) for label in labels], dtype=float)
+
+
+def _ats_vector(split: Dict[str, float]) -> np.ndarray:
+    """Expand a {ats_column: fraction} split into a dense vector in ATS_COLUMNS order."""
+    vec = np.zeros(len(ATS_COLUMNS))
+    for col, frac in split.items():
+        vec[ATS_COLUMNS.index(col)] = frac
+    return vec
+
+
+# -----------------------------
+# Traffic shape lookup tables (UTC hour of day, weekday Monday=0)
+# -----------------------------
+_HOUR_OF_DAY = np.arange(24)
+_DAY_OF_WEEK = np.arange(7)
+
+_HOURLY_BASE_MULT = np.select(
+    [_HOUR_OF_DAY < 6, _HOUR_OF_DAY < 9, _HOUR_OF_DAY < 16, _HOUR_OF_DAY < 19, _HOUR_OF_DAY < 22],
+    [0.42, 0.55 + (_HOUR_OF_DAY - 6) * 0.12, 0.95, 1.10 + (_HOUR_OF_DAY - 16) * 0.12, 1.45],
+    default=0.92,
+)
+_WEEKDAY_MULT = np.where(_DAY_OF_WEEK >= 5, 1.12, 1.00)
+_COMMUTE_HOUR = (7 <= _HOUR_OF_DAY) & (_HOUR_OF_DAY < 9)
+
+
+def _event_strength_table() -> np.ndarray:
+    """(weekday, hour) -> live-event overlay strength."""
+    hour = _HOUR_OF_DAY[None, :]
+    dow = _DAY_OF_WEEK[:, None]
+    prime = (19 <= hour) & (hour < 22)
+    weekend_evening = (18 <= hour) & (hour < 22)
+    sunday_afternoon = (13 <= hour) & (hour < 17)
+
+    event_strength = np.where(((dow == 2) | (dow == 4)) & prime, 0.20, 0.0)
+    event_strength = np.where((dow >= 5) & weekend_evening, np.maximum(event_strength, 0.35), event_strength)
+    event_strength = np.where((dow == 6) & sunday_afternoon, np.maximum(event_strength, 0.18), event_strength)
+    return event_strength
+
+
+_EVENT_STRENGTH = _event_strength_table()
 
 
 # -----------------------------
@@ -160,7 +331,8 @@ def aggregate_logs(df: pd.DataFrame, bucket_minutes: int = 15) -> pd.DataFrame:
             return 0.0
         return float((w * x).sum() / sw)
 
-    grouped = d.groupby(keys, as_index=False)
+    # observed=True: categorical slice dimensions must not expand to every label combination.
+    grouped = d.groupby(keys, as_index=False, observed=True)
     out_sum = grouped[sum_cols].sum()
 
     weighted_rows = []
@@ -217,7 +389,7 @@ def aggregate_logs(df: pd.DataFrame, bucket_minutes: int = 15) -> pd.DataFrame:
 # -----------------------------
 # Generator
 # -----------------------------
-def generate_minute_logs(
+def generate_minute_batches(
     start_ts_utc: datetime,
     minutes: int,
     n_partners: int = 6,
@@ -230,117 +402,107 @@ def generate_minute_logs(
     seed: int = 7,
     incidents: List[Incident] | None = None,
     density: float = 0.10,
-) -> pd.DataFrame:
+    pool_seed: int | None = None,
+) -> Iterator[Dict[str, object]]:
     """
-    Generate minute-level aggregated CDN-like telemetry.
-    Each row = 1 minute × 1 slice.
-    Returns a DataFrame (no file I/O here).
-
-    Guarantees:
-    - http_2xx + http_3xx + http_4xx + http_5xx == requests
-    - status_200 + status_206 == http_2xx
-    - status_304 == http_3xx
-    - status_403 + status_404 + status_429 == http_4xx
-    - status_500 + status_502 + status_503 + status_504 == http_5xx
-
-    Phase 7 scope:
-    - keep realistic traffic/state/ATS/latency/correlation logic
-    - update aggregation support for ATS columns
+    Stream minute-level telemetry one minute at a time.
+    Yields one batch per minute that has traffic: a dict of equal-length
+    columns in RAW_MINUTE_COLUMNS order (ts as naive UTC datetime64, slice
+    dimensions as integer category codes into dimension_labels(...) for
+    the same parameters, metrics as NumPy arrays).
+
+    Same parameters, RNG stream and rows as generate_minute_logs, which
+    simply concatenates these batches; use this to emit long ranges
+    without holding the whole DataFrame in memory.
     """
     rng = np.random.default_rng(seed)
 
-    services = services or DEFAULT_SERVICES
-    regions = regions or DEFAULT_REGIONS
-    content_types = content_types or DEFAULT_CONTENT_TYPES
-    ua_families = ua_families or DEFAULT_UA_FAMILIES
+    labels = dimension_labels(n_partners, n_pops, n_hosts, services, regions, content_types, ua_families)
+    partners = labels["partner"]
+    services = labels["service"]
+    regions = labels["region"]
+    pops = labels["pop"]
+    hosts = labels["host"]
+    content_types = labels["content_type"]
+    ua_families = labels["ua_family"]
     incidents = incidents or []
 
     ts0 = _utc_minute_floor(start_ts_utc)
 
-    partners = [f"partner_{i:02d}" for i in range(1, n_partners + 1)]
-    pops = [f"pop_{i:03d}" for i in range(1, n_pops + 1)]
-    hosts = [f"host_{i:04d}" for i in range(1, n_hosts + 1)]
-
-    slice_pool: List[Tuple[str, str, str, str, str, str, str]] = []
-    for _ in range(5000):
-        slice_pool.append(
-            (
-                rng.choice(partners),
-                rng.choice(services),
-                rng.choice(regions),
-                rng.choice(pops),
-                rng.choice(hosts),
-                rng.choice(content_types),
-                rng.choice(ua_families),
-            )
-        )
+    # Slice pool as SoA category codes: slice i = (pool_partner[i], pool_service[i], ...).
+    # A fixed pool keeps slice identities stable across minutes.
+    pool_size = SLICE_POOL_SIZE
+
+    pool_rng = rng if pool_seed is None else np.random.default_rng(pool_seed)
+
+    def _pool_codes(labels: List[str]) -> np.ndarray:
+        return pool_rng.integers(0, len(labels), size=pool_size, dtype=_code_dtype(len(labels)))
+
+    pool_partner = _pool_codes(partners)
+    pool_service = _pool_codes(services)
+    pool_region = _pool_codes(regions)
+    pool_pop = _pool_codes(pops)
+    pool_host = _pool_codes(hosts)
+    pool_ctype = _pool_codes(content_types)
+    pool_ua = _pool_codes(ua_families)
 
     # -----------------------------
-    # Phase 2 traffic shaping helpers
+    # Per-dimension lookup tables (indexed by category code)
     # -----------------------------
-    def _hourly_base_multiplier(hour: int) -> float:
-        if 0 <= hour < 6:
-            return 0.42
-        if 6 <= hour < 9:
-            return 0.55 + (hour - 6) * 0.12
-        if 9 <= hour < 16:
-            return 0.95
-        if 16 <= hour < 19:
-            return 1.10 + (hour - 16) * 0.12
-        if 19 <= hour < 22:
-            return 1.45
-        return 0.92
-
-    def _weekend_modifier(ts: datetime) -> float:
-        return 1.12 if ts.weekday() >= 5 else 1.00
-
-    def _commute_modifier(ts: datetime, service: str, ctype: str) -> float:
-        if 7 <= ts.hour < 9:
-            if service in {"live", "live_ott", "vod"} and ctype == "manifest":
-                return 1.08
-        return 1.00
+    base_rps_arr = _lookup_array(services, DEFAULT_SERVICES, SERVICE_BASE_RPS, 30)
+    svc_add_arr = _lookup_array(services, DEFAULT_SERVICES, SERVICE_P50_ADD_MS, 15)
+    svc_is_app_backend = np.array([s == "app_backend" for s in services])
+    svc_is_live = np.array([s in {"live", "live_ott"} for s in services])
+
+    ctype_mult_arr = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_RPS_MULT, 0.6)
+    base_cache_arr = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_BASE_CACHE_HIT, 0.75)
+    base_p50_arr = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_BASE_P50_MS, 110)
+    avg_bytes_arr = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_AVG_BYTES, 120_000)
+    ct_is_manifest = np.array([c == "manifest" for c in content_types])
+    ct_is_api = np.array([c == "api" for c in content_types])
+
+    # Content profiles shared by the ATS and latency models: segment / manifest / everything else.
+    CT_SEGMENT, CT_MANIFEST, CT_OTHER = 0, 1, 2
+    ct_profile = np.array(
+        [CT_SEGMENT if c == "segment" else CT_MANIFEST if c == "manifest" else CT_OTHER for c in content_types],
+        dtype=np.int8,
+    )
+
+    region_mult_arr = np.array([1.0 + (0.15 if r.startswith("us") else 0.05) for r in regions])
 
-    def _event_overlay(ts: datetime, service: str, ctype: str) -> float:
-        dow = ts.weekday()
-        hour = ts.hour
+    # -----------------------------
+    # Phase 2 traffic shaping helpers
+    # -----------------------------
+    # Minute timeline (UTC), computed once and indexed by minute offset.
+    ts_arr = np.datetime64(ts0.replace(tzinfo=None), "m") + np.arange(minutes)
+    hour_arr = ts_arr.astype("datetime64[h]").astype(np.int64) % 24
+    dow_arr = (ts_arr.astype("datetime64[D]").astype(np.int64) + 3) % 7  # Monday=0, as datetime.weekday()
 
-        event_strength = 0.0
+    base_mult_by_minute = _HOURLY_BASE_MULT[hour_arr] * _WEEKDAY_MULT[dow_arr]
+    commute_by_minute = _COMMUTE_HOUR[hour_arr]
+    event_by_minute = _EVENT_STRENGTH[dow_arr, hour_arr]
 
-        if dow in {2, 4} and 19 <= hour < 22:
-            event_strength = 0.20
+    svc_commute = np.array([s in {"live", "live_ott", "vod"} for s in services])
 
-        if dow in {5, 6} and 18 <= hour < 22:
-            event_strength = max(event_strength, 0.35)
+    def _commute_modifier(m: int, svc: np.ndarray, ct: np.ndarray) -> np.ndarray | float:
+        if commute_by_minute[m]:
+            return np.where(svc_commute[svc] & ct_is_manifest[ct], 1.08, 1.00)
+        return 1.00
 
-        if dow == 6 and 13 <= hour < 17:
-            event_strength = max(event_strength, 0.18)
+    svc_event_sensitivity = _lookup_array(services, DEFAULT_SERVICES, SERVICE_EVENT_SENSITIVITY, 1.0)
+    ct_event_sensitivity = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_EVENT_SENSITIVITY, 1.0)
 
+    def _event_overlay(m: int, svc: np.ndarray, ct: np.ndarray) -> np.ndarray | float:
+        event_strength = event_by_minute[m]
         if event_strength <= 0.0:
             return 1.0
 
-        service_sensitivity = {
-            "live": 1.35,
-            "live_ott": 1.28,
-            "vod": 1.05,
-            "dvr": 1.00,
-            "eas": 0.95,
-            "app_backend": 0.88,
-        }.get(service, 1.0)
-
-        content_sensitivity = {
-            "segment": 1.25,
-            "manifest": 1.08,
-            "api": 0.82,
-        }.get(ctype, 1.0)
-
-        return 1.0 + (event_strength * service_sensitivity * content_sensitivity)
+        return 1.0 + (event_strength * svc_event_sensitivity[svc] * ct_event_sensitivity[ct])
 
-    def traffic_multiplier(ts: datetime, service: str, ctype: str) -> float:
-        base = _hourly_base_multiplier(ts.hour)
-        weekend = _weekend_modifier(ts)
-        commute = _commute_modifier(ts, service, ctype)
-        event = _event_overlay(ts, service, ctype)
-        return base * weekend * commute * event
+    def traffic_multiplier(m: int, svc: np.ndarray, ct: np.ndarray) -> np.ndarray:
+        commute = _commute_modifier(m, svc, ct)
+        event = _event_overlay(m, svc, ct)
+        return base_mult_by_minute[m] * commute * event
 
     # -----------------------------
     # Phase 3 sticky minute-state engine
@@ -353,10 +515,11 @@ def generate_minute_logs(
         "bad_incident",
     ]
 
-    def _state_transition_probs(current_state: str, ts: datetime, service: str) -> list[float]:
-        hour = ts.hour
-        dow = ts.weekday()
+    def _state_table(table: Dict[str, object]) -> np.ndarray:
+        """Per-state lookup table indexed by state code (position in STATES)."""
+        return np.array([table[state] for state in STATES], dtype=float)
 
+    def _state_transition_probs(current_state: str, hour: int, dow: int, service: str) -> list[float]:
         prime_risk = 0.0
         if 18 <= hour < 22:
             prime_risk += 0.015
@@ -395,339 +558,271 @@ def generate_minute_logs(
         total = sum(probs)
         return [p / total for p in probs]
 
-    def _build_service_state_timelines() -> dict[str, list[str]]:
-        timelines: dict[str, list[str]] = {}
-        for service in services:
-            current_state = "healthy"
-            service_states: list[str] = []
+    def _build_service_state_timelines() -> np.ndarray:
+        """State codes shaped (n_services, minutes)."""
+        timelines = np.zeros((len(services), minutes), dtype=np.int8)
+        for svc_code, service in enumerate(services):
+            current_state = 0
 
             for minute_idx in range(minutes):
-                ts = ts0 + timedelta(minutes=minute_idx)
-                probs = _state_transition_probs(current_state, ts, service)
-                current_state = str(rng.choice(STATES, p=probs))
-                service_states.append(current_state)
+                probs = _state_transition_probs(
+                    STATES[current_state], int(hour_arr[minute_idx]), int(dow_arr[minute_idx]), service
+                )
+                current_state = int(rng.choice(len(STATES), p=probs))
+                timelines[svc_code, minute_idx] = current_state
 
-            timelines[service] = service_states
         return timelines
 
     service_state_timelines = _build_service_state_timelines()
 
-    def _state_request_multiplier(state: str) -> float:
-        return {
+    STATE_REQUEST_MULT = _state_table(
+        {
             "healthy": 1.00,
             "cache_pressure": 0.98,
             "origin_slow": 0.99,
             "network_issue": 0.96,
             "bad_incident": 0.93,
-        }[state]
+        }
+    )
 
-    def _state_cache_delta(state: str) -> float:
-        return {
+    STATE_CACHE_DELTA = _state_table(
+        {
             "healthy": 0.00,
             "cache_pressure": -0.08,
             "origin_slow": -0.03,
             "network_issue": -0.02,
             "bad_incident": -0.15,
-        }[state]
+        }
+    )
 
-    def _state_latency_multipliers(state: str) -> tuple[float, float, float]:
-        return {
+    STATE_LATENCY_MULT = _state_table(
+        {
             "healthy": (1.00, 1.00, 1.00),
             "cache_pressure": (1.05, 1.12, 1.20),
             "origin_slow": (1.12, 1.30, 1.45),
             "network_issue": (1.08, 1.24, 1.52),
             "bad_incident": (1.28, 1.62, 2.00),
-        }[state]
+        }
+    )
 
     # -----------------------------
     # Phase 4 ATS distribution
     # -----------------------------
-    def _ats_family_targets(
-        state: str,
-        ctype: str,
-        service: str,
-        cache_hit: float,
-    ) -> Dict[str, float]:
-        if ctype == "segment":
-            hit_family = _clamp(cache_hit, 0.74, 0.90)
-            miss_family = 0.11
-            refresh_ims_family = 0.035
-            client_issue_family = 0.020
-            infra_fail_family = 0.004
-            rare_family = 0.001
-        elif ctype == "manifest":
-            hit_family = _clamp(cache_hit, 0.70, 0.86)
-            miss_family = 0.09
-            refresh_ims_family = 0.080
-            client_issue_family = 0.020
-            infra_fail_family = 0.008
-            rare_family = 0.002
-        else:
-            hit_family = _clamp(cache_hit, 0.52, 0.70)
-            miss_family = 0.22
-            refresh_ims_family = 0.035
-            client_issue_family = 0.025
-            infra_fail_family = 0.015
-            rare_family = 0.005
-
-        base_non_hit = (
-            miss_family
-            + refresh_ims_family
-            + client_issue_family
-            + infra_fail_family
-            + rare_family
-        )
-        residual = max(0.0, 1.0 - hit_family)
-        scale = residual / base_non_hit if base_non_hit > 0 else 1.0
-
-        miss_family *= scale
-        refresh_ims_family *= scale
-        client_issue_family *= scale
-        infra_fail_family *= scale
-        rare_family *= scale
-
-        if state == "cache_pressure":
-            hit_family -= 0.10
-            miss_family += 0.07
-            refresh_ims_family += 0.02
-            client_issue_family += 0.005
-            infra_fail_family += 0.003
-            rare_family += 0.002
-        elif state == "origin_slow":
-            hit_family -= 0.06
-            miss_family += 0.05
-            refresh_ims_family += 0.01
-            client_issue_family += 0.004
-            infra_fail_family += 0.010
-            rare_family += 0.002
-        elif state == "network_issue":
-            hit_family -= 0.05
-            miss_family += 0.02
-            refresh_ims_family += 0.005
-            client_issue_family += 0.020
-            infra_fail_family += 0.018
-            rare_family += 0.002
-        elif state == "bad_incident":
-            hit_family -= 0.16
-            miss_family += 0.08
-            refresh_ims_family += 0.02
-            client_issue_family += 0.020
-            infra_fail_family += 0.030
-            rare_family += 0.010
-
-        if service in {"live", "live_ott"} and ctype == "segment":
-            hit_family = min(hit_family + 0.02, 0.92)
-            miss_family = max(miss_family - 0.01, 0.01)
-        if service == "app_backend" and ctype == "api":
-            infra_fail_family += 0.005
-            hit_family -= 0.005
-
-        families = {
-            "hit_family": max(0.0, hit_family),
-            "miss_family": max(0.0, miss_family),
-            "refresh_ims_family": max(0.0, refresh_ims_family),
-            "client_issue_family": max(0.0, client_issue_family),
-            "infra_fail_family": max(0.0, infra_fail_family),
-            "rare_family": max(0.0, rare_family),
-        }
-
-        total = sum(families.values())
-        return {k: v / total for k, v in families.items()}
+    # Per content profile: hit clamp (lo, hi), then miss / refresh_ims / client_issue / infra_fail / rare.
+    ATS_FAMILY_BASE = np.array(
+        [
+            [0.74, 0.90, 0.11, 0.035, 0.020, 0.004, 0.001],  # segment
+            [0.70, 0.86, 0.09, 0.080, 0.020, 0.008, 0.002],  # manifest
+            [0.52, 0.70, 0.22, 0.035, 0.025, 0.015, 0.005],  # other (api-like)
+        ]
+    )
 
-    def _ats_code_probs(
-        state: str,
-        ctype: str,
-        service: str,
-        cache_hit: float,
-    ) -> Dict[str, float]:
-        fam = _ats_family_targets(state, ctype, service, cache_hit)
-
-        if ctype == "segment":
-            hit_split = {
-                "ats_tcp_hit_count": 0.86,
-                "ats_tcp_cf_hit_count": 0.14,
-            }
-            miss_split = {
-                "ats_tcp_miss_count": 0.70,
-                "ats_tcp_refresh_miss_count": 0.22,
-                "ats_tcp_ref_fail_hit_count": 0.08,
-            }
-            refresh_split = {
-                "ats_tcp_refresh_hit_count": 0.36,
-                "ats_tcp_client_refresh_count": 0.14,
-                "ats_tcp_ims_hit_count": 0.26,
-                "ats_tcp_ims_miss_count": 0.24,
-            }
-        elif ctype == "manifest":
-            hit_split = {
-                "ats_tcp_hit_count": 0.80,
-                "ats_tcp_cf_hit_count": 0.20,
-            }
-            miss_split = {
-                "ats_tcp_miss_count": 0.52,
-                "ats_tcp_refresh_miss_count": 0.24,
-                "ats_tcp_ref_fail_hit_count": 0.24,
-            }
-            refresh_split = {
-                "ats_tcp_refresh_hit_count": 0.28,
-                "ats_tcp_client_refresh_count": 0.22,
-                "ats_tcp_ims_hit_count": 0.22,
-                "ats_tcp_ims_miss_count": 0.28,
-            }
-        else:
-            hit_split = {
-                "ats_tcp_hit_count": 0.72,
-                "ats_tcp_cf_hit_count": 0.28,
-            }
-            miss_split = {
-                "ats_tcp_miss_count": 0.76,
-                "ats_tcp_refresh_miss_count": 0.14,
-                "ats_tcp_ref_fail_hit_count": 0.10,
-            }
-            refresh_split = {
-                "ats_tcp_refresh_hit_count": 0.42,
-                "ats_tcp_client_refresh_count": 0.18,
-                "ats_tcp_ims_hit_count": 0.20,
-                "ats_tcp_ims_miss_count": 0.20,
-            }
+    # Additive per-state shift: hit / miss / refresh_ims / client_issue / infra_fail / rare.
+    ATS_FAMILY_STATE_SHIFT = _state_table(
+        {
+            "healthy": (0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+            "cache_pressure": (-0.10, 0.07, 0.02, 0.005, 0.003, 0.002),
+            "origin_slow": (-0.06, 0.05, 0.01, 0.004, 0.010, 0.002),
+            "network_issue": (-0.05, 0.02, 0.005, 0.020, 0.018, 0.002),
+            "bad_incident": (-0.16, 0.08, 0.02, 0.020, 0.030, 0.010),
+        }
+    )
 
-        if state == "network_issue":
-            client_split = {
-                "ats_err_client_abort_count": 0.42,
-                "ats_err_client_read_error_count": 0.58,
-            }
-            infra_split = {
-                "ats_err_connect_fail_count": 0.24,
-                "ats_err_dns_fail_count": 0.10,
-                "ats_err_read_timeout_count": 0.66,
-            }
-        elif state == "origin_slow":
-            client_split = {
-                "ats_err_client_abort_count": 0.60,
-                "ats_err_client_read_error_count": 0.40,
-            }
-            infra_split = {
-                "ats_err_connect_fail_count": 0.26,
-                "ats_err_dns_fail_count": 0.08,
-                "ats_err_read_timeout_count": 0.66,
-            }
-        elif state == "bad_incident":
-            client_split = {
-                "ats_err_client_abort_count": 0.55,
-                "ats_err_client_read_error_count": 0.45,
-            }
-            infra_split = {
-                "ats_err_connect_fail_count": 0.30,
-                "ats_err_dns_fail_count": 0.12,
-                "ats_err_read_timeout_count": 0.58,
-            }
-        else:
-            client_split = {
-                "ats_err_client_abort_count": 0.68,
-                "ats_err_client_read_error_count": 0.32,
-            }
-            infra_split = {
-                "ats_err_connect_fail_count": 0.34,
-                "ats_err_dns_fail_count": 0.10,
-                "ats_err_read_timeout_count": 0.56,
-            }
+    def _ats_family_targets(
+        state: np.ndarray,
+        prof: np.ndarray,
+        svc: np.ndarray,
+        ct: np.ndarray,
+        cache_hit: np.ndarray,
+    ) -> np.ndarray:
+        """Normalized family shares shaped (n, 6), same family order as ATS_FAMILY_STATE_SHIFT."""
+        base = ATS_FAMILY_BASE[prof]
+        hit_family = np.clip(cache_hit, base[:, 0], base[:, 1])
+
+        non_hit = base[:, 2:]
+        residual = np.maximum(0.0, 1.0 - hit_family)
+        scale = residual / non_hit.sum(axis=1)
+
+        fam = np.column_stack([hit_family, non_hit * scale[:, None]])
+        fam += ATS_FAMILY_STATE_SHIFT[state]
+
+        live_segment = svc_is_live[svc] & (prof == CT_SEGMENT)
+        fam[:, 0] = np.where(live_segment, np.minimum(fam[:, 0] + 0.02, 0.92), fam[:, 0])
+        fam[:, 1] = np.where(live_segment, np.maximum(fam[:, 1] - 0.01, 0.01), fam[:, 1])
+
+        backend_api = svc_is_app_backend[svc] & ct_is_api[ct]
+        fam[:, 4] += np.where(backend_api, 0.005, 0.0)
+        fam[:, 0] -= np.where(backend_api, 0.005, 0.0)
+
+        fam = np.maximum(0.0, fam)
+        return fam / fam.sum(axis=1, keepdims=True)
+
+    # Family -> ATS code splits; rows are content profiles (segment / manifest / other).
+    ATS_HIT_SPLIT = np.array(
+        [
+            _ats_vector({"ats_tcp_hit_count": 0.86, "ats_tcp_cf_hit_count": 0.14}),
+            _ats_vector({"ats_tcp_hit_count": 0.80, "ats_tcp_cf_hit_count": 0.20}),
+            _ats_vector({"ats_tcp_hit_count": 0.72, "ats_tcp_cf_hit_count": 0.28}),
+        ]
+    )
+    ATS_MISS_SPLIT = np.array(
+        [
+            _ats_vector(
+                {
+                    "ats_tcp_miss_count": 0.70,
+                    "ats_tcp_refresh_miss_count": 0.22,
+                    "ats_tcp_ref_fail_hit_count": 0.08,
+                }
+            ),
+            _ats_vector(
+                {
+                    "ats_tcp_miss_count": 0.52,
+                    "ats_tcp_refresh_miss_count": 0.24,
+                    "ats_tcp_ref_fail_hit_count": 0.24,
+                }
+            ),
+            _ats_vector(
+                {
+                    "ats_tcp_miss_count": 0.76,
+                    "ats_tcp_refresh_miss_count": 0.14,
+                    "ats_tcp_ref_fail_hit_count": 0.10,
+                }
+            ),
+        ]
+    )
+    ATS_REFRESH_SPLIT = np.array(
+        [
+            _ats_vector(
+                {
+                    "ats_tcp_refresh_hit_count": 0.36,
+                    "ats_tcp_client_refresh_count": 0.14,
+                    "ats_tcp_ims_hit_count": 0.26,
+                    "ats_tcp_ims_miss_count": 0.24,
+                }
+            ),
+            _ats_vector(
+                {
+                    "ats_tcp_refresh_hit_count": 0.28,
+                    "ats_tcp_client_refresh_count": 0.22,
+                    "ats_tcp_ims_hit_count": 0.22,
+                    "ats_tcp_ims_miss_count": 0.28,
+                }
+            ),
+            _ats_vector(
+                {
+                    "ats_tcp_refresh_hit_count": 0.42,
+                    "ats_tcp_client_refresh_count": 0.18,
+                    "ats_tcp_ims_hit_count": 0.20,
+                    "ats_tcp_ims_miss_count": 0.20,
+                }
+            ),
+        ]
+    )
 
-        rare_split = {
+    # Client/infra splits follow the minute state; rows are state codes.
+    default_client_split = _ats_vector(
+        {"ats_err_client_abort_count": 0.68, "ats_err_client_read_error_count": 0.32}
+    )
+    default_infra_split = _ats_vector(
+        {
+            "ats_err_connect_fail_count": 0.34,
+            "ats_err_dns_fail_count": 0.10,
+            "ats_err_read_timeout_count": 0.56,
+        }
+    )
+    ATS_CLIENT_SPLIT = _state_table(
+        {
+            "healthy": default_client_split,
+            "cache_pressure": default_client_split,
+            "origin_slow": _ats_vector(
+                {"ats_err_client_abort_count": 0.60, "ats_err_client_read_error_count": 0.40}
+            ),
+            "network_issue": _ats_vector(
+                {"ats_err_client_abort_count": 0.42, "ats_err_client_read_error_count": 0.58}
+            ),
+            "bad_incident": _ats_vector(
+                {"ats_err_client_abort_count": 0.55, "ats_err_client_read_error_count": 0.45}
+            ),
+        }
+    )
+    ATS_INFRA_SPLIT = _state_table(
+        {
+            "healthy": default_infra_split,
+            "cache_pressure": default_infra_split,
+            "origin_slow": _ats_vector(
+                {
+                    "ats_err_connect_fail_count": 0.26,
+                    "ats_err_dns_fail_count": 0.08,
+                    "ats_err_read_timeout_count": 0.66,
+                }
+            ),
+            "network_issue": _ats_vector(
+                {
+                    "ats_err_connect_fail_count": 0.24,
+                    "ats_err_dns_fail_count": 0.10,
+                    "ats_err_read_timeout_count": 0.66,
+                }
+            ),
+            "bad_incident": _ats_vector(
+                {
+                    "ats_err_connect_fail_count": 0.30,
+                    "ats_err_dns_fail_count": 0.12,
+                    "ats_err_read_timeout_count": 0.58,
+                }
+            ),
+        }
+    )
+    ATS_RARE_SPLIT = _ats_vector(
+        {
             "ats_tcp_swapfail_count": 0.20,
             "ats_err_invalid_req_count": 0.28,
             "ats_err_proxy_denied_count": 0.16,
             "ats_err_unknown_count": 0.36,
         }
+    )
 
-        probs = {col: 0.0 for col in ATS_COLUMNS}
-
-        for col, frac in hit_split.items():
-            probs[col] += fam["hit_family"] * frac
-        for col, frac in miss_split.items():
-            probs[col] += fam["miss_family"] * frac
-        for col, frac in refresh_split.items():
-            probs[col] += fam["refresh_ims_family"] * frac
-        for col, frac in client_split.items():
-            probs[col] += fam["client_issue_family"] * frac
-        for col, frac in infra_split.items():
-            probs[col] += fam["infra_fail_family"] * frac
-        for col, frac in rare_split.items():
-            probs[col] += fam["rare_family"] * frac
-
-        total = sum(probs.values())
-        return {k: v / total for k, v in probs.items()}
+    def _ats_code_probs(
+        state: np.ndarray,
+        prof: np.ndarray,
+        svc: np.ndarray,
+        ct: np.ndarray,
+        cache_hit: np.ndarray,
+    ) -> np.ndarray:
+        """Per-row probabilities over ATS_COLUMNS, shaped (n, len(ATS_COLUMNS))."""
+        fam = _ats_family_targets(state, prof, svc, ct, cache_hit)
+
+        probs = (
+            fam[:, 0:1] * ATS_HIT_SPLIT[prof]
+            + fam[:, 1:2] * ATS_MISS_SPLIT[prof]
+            + fam[:, 2:3] * ATS_REFRESH_SPLIT[prof]
+            + fam[:, 3:4] * ATS_CLIENT_SPLIT[state]
+            + fam[:, 4:5] * ATS_INFRA_SPLIT[state]
+            + fam[:, 5:6] * ATS_RARE_SPLIT
+        )
+        return probs / probs.sum(axis=1, keepdims=True)
 
     def _sample_ats_counts(
-        requests: int,
-        state: str,
-        ctype: str,
-        service: str,
-        cache_hit: float,
-    ) -> Dict[str, int]:
-        probs = _ats_code_probs(state, ctype, service, cache_hit)
-        sampled = rng.multinomial(requests, [probs[col] for col in ATS_COLUMNS])
-        return {col: int(sampled[i]) for i, col in enumerate(ATS_COLUMNS)}
-
-    def _ats_family_shares(ats_counts: Dict[str, int], requests: int) -> Dict[str, float]:
-        if requests <= 0:
-            return {
-                "hit_family": 0.0,
-                "miss_family": 0.0,
-                "refresh_ims": 0.0,
-                "client_issues": 0.0,
-                "infra": 0.0,
-                "rare": 0.0,
-            }
-
-        hit_family = (
-            ats_counts["ats_tcp_hit_count"]
-            + ats_counts["ats_tcp_cf_hit_count"]
-        ) / requests
-
-        miss_family = (
-            ats_counts["ats_tcp_miss_count"]
-            + ats_counts["ats_tcp_refresh_miss_count"]
-            + ats_counts["ats_tcp_ref_fail_hit_count"]
-        ) / requests
-
-        refresh_ims = (
-            ats_counts["ats_tcp_refresh_hit_count"]
-            + ats_counts["ats_tcp_client_refresh_count"]
-            + ats_counts["ats_tcp_ims_hit_count"]
-            + ats_counts["ats_tcp_ims_miss_count"]
-        ) / requests
-
-        client_issues = (
-            ats_counts["ats_err_client_abort_count"]
-            + ats_counts["ats_err_client_read_error_count"]
-        ) / requests
-
-        infra = (
-            ats_counts["ats_err_connect_fail_count"]
-            + ats_counts["ats_err_dns_fail_count"]
-            + ats_counts["ats_err_read_timeout_count"]
-        ) / requests
-
-        rare = (
-            ats_counts["ats_tcp_swapfail_count"]
-            + ats_counts["ats_err_invalid_req_count"]
-            + ats_counts["ats_err_proxy_denied_count"]
-            + ats_counts["ats_err_unknown_count"]
-        ) / requests
-
+        requests: np.ndarray,
+        state: np.ndarray,
+        prof: np.ndarray,
+        svc: np.ndarray,
+        ct: np.ndarray,
+        cache_hit: np.ndarray,
+    ) -> np.ndarray:
+        probs = _ats_code_probs(state, prof, svc, ct, cache_hit)
+        return rng.multinomial(requests, probs)
+
+    def _ats_family_shares(ats_counts: np.ndarray, requests: np.ndarray) -> Dict[str, np.ndarray]:
+        denom = np.where(requests > 0, requests, 1)
         return {
-            "hit_family": float(hit_family),
-            "miss_family": float(miss_family),
-            "refresh_ims": float(refresh_ims),
-            "client_issues": float(client_issues),
-            "infra": float(infra),
-            "rare": float(rare),
+            family: ats_counts[:, cols].sum(axis=1) / denom
+            for family, cols in _ATS_FAMILY_INDEX.items()
         }
 
     # -----------------------------
     # Phase 5 latency shaping
     # -----------------------------
-    def _ats_latency_pressure(ats_counts: Dict[str, int], requests: int) -> Dict[str, float]:
+    def _ats_latency_pressure(ats_counts: np.ndarray, requests: np.ndarray) -> Dict[str, np.ndarray]:
         fam = _ats_family_shares(ats_counts, requests)
         return {
             "miss_rate": fam["miss_family"],
@@ -737,32 +832,30 @@ def generate_minute_logs(
             "rare_rate": fam["rare"],
         }
 
-    def _content_latency_scalars(ctype: str) -> Dict[str, float]:
-        if ctype == "segment":
-            return {
-                "base_floor_mult": 1.38,
-                "miss_weight": 4.1,
-                "refresh_weight": 1.35,
-                "client_weight": 2.2,
-                "infra_weight": 5.1,
-                "rare_weight": 2.3,
-                "p50_gain": 0.72,
-                "p95_gain": 1.55,
-                "p99_gain": 2.30,
-            }
-        if ctype == "manifest":
-            return {
-                "base_floor_mult": 1.10,
-                "miss_weight": 2.5,
-                "refresh_weight": 1.95,
-                "client_weight": 1.7,
-                "infra_weight": 3.9,
-                "rare_weight": 1.8,
-                "p50_gain": 0.45,
-                "p95_gain": 1.08,
-                "p99_gain": 1.68,
-            }
-        return {
+    content_latency_scalars = {
+        CT_SEGMENT: {
+            "base_floor_mult": 1.38,
+            "miss_weight": 4.1,
+            "refresh_weight": 1.35,
+            "client_weight": 2.2,
+            "infra_weight": 5.1,
+            "rare_weight": 2.3,
+            "p50_gain": 0.72,
+            "p95_gain": 1.55,
+            "p99_gain": 2.30,
+        },
+        CT_MANIFEST: {
+            "base_floor_mult": 1.10,
+            "miss_weight": 2.5,
+            "refresh_weight": 1.95,
+            "client_weight": 1.7,
+            "infra_weight": 3.9,
+            "rare_weight": 1.8,
+            "p50_gain": 0.45,
+            "p95_gain": 1.08,
+            "p99_gain": 1.68,
+        },
+        CT_OTHER: {
             "base_floor_mult": 0.82,
             "miss_weight": 0.95,
             "refresh_weight": 0.65,
@@ -772,19 +865,34 @@ def generate_minute_logs(
             "p50_gain": 0.14,
             "p95_gain": 0.42,
             "p99_gain": 0.76,
+        },
+    }
+    LATENCY_SCALARS = {
+        key: np.array([content_latency_scalars[p][key] for p in (CT_SEGMENT, CT_MANIFEST, CT_OTHER)])
+        for key in content_latency_scalars[CT_SEGMENT]
+    }
+
+    STATE_LATENCY_BOOST = _state_table(
+        {
+            "healthy": 1.00,
+            "cache_pressure": 1.08,
+            "origin_slow": 1.14,
+            "network_issue": 1.18,
+            "bad_incident": 1.28,
         }
+    )
 
     def _apply_latency_pressure(
-        p50: float,
-        p95: float,
-        p99: float,
-        ctype: str,
-        ats_counts: Dict[str, int],
-        requests: int,
-        minute_state: str,
-    ) -> tuple[float, float, float]:
+        p50: np.ndarray,
+        p95: np.ndarray,
+        p99: np.ndarray,
+        prof: np.ndarray,
+        ats_counts: np.ndarray,
+        requests: np.ndarray,
+        state: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         pressure = _ats_latency_pressure(ats_counts, requests)
-        weights = _content_latency_scalars(ctype)
+        weights = {key: table[prof] for key, table in LATENCY_SCALARS.items()}
 
         severity = (
             pressure["miss_rate"] * weights["miss_weight"]
@@ -794,33 +902,30 @@ def generate_minute_logs(
             + pressure["rare_rate"] * weights["rare_weight"]
         )
 
-        state_boost = {
-            "healthy": 1.00,
-            "cache_pressure": 1.08,
-            "origin_slow": 1.14,
-            "network_issue": 1.18,
-            "bad_incident": 1.28,
-        }[minute_state]
-
-        severity *= state_boost
-
-        p50 *= weights["base_floor_mult"]
-        p95 *= weights["base_floor_mult"]
-        p99 *= weights["base_floor_mult"]
-
-        if ctype == "segment":
-            playback_pressure = pressure["miss_rate"] + pressure["infra_rate"] + (0.45 * pressure["client_issue_rate"])
-            p95 *= 1.0 + (playback_pressure * 1.15)
-            p99 *= 1.0 + (playback_pressure * 1.55)
-        elif ctype == "manifest":
-            manifest_pressure = pressure["refresh_ims_rate"] + (0.55 * pressure["miss_rate"]) + (0.35 * pressure["infra_rate"])
-            p95 *= 1.0 + (manifest_pressure * 0.42)
-            p99 *= 1.0 + (manifest_pressure * 0.58)
-        else:
-            api_damp = 1.0 - min(0.22, pressure["refresh_ims_rate"] * 0.45)
-            p50 *= api_damp
-            p95 *= api_damp
-            p99 *= api_damp
+        severity *= STATE_LATENCY_BOOST[state]
+
+        p50 = p50 * weights["base_floor_mult"]
+        p95 = p95 * weights["base_floor_mult"]
+        p99 = p99 * weights["base_floor_mult"]
+
+        segment = prof == CT_SEGMENT
+        manifest = prof == CT_MANIFEST
+
+        playback_pressure = pressure["miss_rate"] + pressure["infra_rate"] + (0.45 * pressure["client_issue_rate"])
+        manifest_pressure = pressure["refresh_ims_rate"] + (0.55 * pressure["miss_rate"]) + (0.35 * pressure["infra_rate"])
+        api_damp = 1.0 - np.minimum(0.22, pressure["refresh_ims_rate"] * 0.45)
+
+        p50 = p50 * np.where(segment | manifest, 1.0, api_damp)
+        p95 = p95 * np.select(
+            [segment, manifest],
+            [1.0 + (playback_pressure * 1.15), 1.0 + (manifest_pressure * 0.42)],
+            default=api_damp,
+        )
+        p99 = p99 * np.select(
+            [segment, manifest],
+            [1.0 + (playback_pressure * 1.55), 1.0 + (manifest_pressure * 0.58)],
+            default=api_damp,
+        )
 
         p50 *= 1.0 + (severity * weights["p50_gain"])
         p95 *= 1.0 + (severity * weights["p95_gain"])
@@ -831,12 +936,22 @@ def generate_minute_logs(
     # -----------------------------
     # Phase 6 correlation helpers
     # -----------------------------
+    STATE_CACHE_SHIFT = _state_table(
+        {
+            "healthy": 0.00,
+            "cache_pressure": -0.04,
+            "origin_slow": -0.02,
+            "network_issue": -0.02,
+            "bad_incident": -0.06,
+        }
+    )
+
     def _derive_cache_hit_rate(
-        base_cache_hit: float,
-        ats_counts: Dict[str, int],
-        requests: int,
-        minute_state: str,
-    ) -> float:
+        base_cache_hit: np.ndarray,
+        ats_counts: np.ndarray,
+        requests: np.ndarray,
+        state: np.ndarray,
+    ) -> np.ndarray:
         fam = _ats_family_shares(ats_counts, requests)
 
         ats_cache_view = (
@@ -847,87 +962,83 @@ def generate_minute_logs(
             - 0.15 * fam["client_issues"]
         )
 
-        state_shift = {
-            "healthy": 0.00,
-            "cache_pressure": -0.04,
-            "origin_slow": -0.02,
-            "network_issue": -0.02,
-            "bad_incident": -0.06,
-        }[minute_state]
-
         blended = (
             0.40 * base_cache_hit
-            + 0.60 * _clamp(ats_cache_view, 0.02, 0.99)
-            + state_shift
+            + 0.60 * np.clip(ats_cache_view, 0.02, 0.99)
+            + STATE_CACHE_SHIFT[state]
         )
-        return float(_clamp(blended, 0.02, 0.99))
+        return np.clip(blended, 0.02, 0.99)
+
+    STATE_5XX_MULT = _state_table(
+        {
+            "healthy": (1.0, 1.0, 1.0, 1.0),
+            "cache_pressure": (1.0, 1.1, 1.25, 1.1),
+            "origin_slow": (1.15, 1.2, 1.65, 1.35),
+            "network_issue": (1.0, 1.25, 1.25, 1.9),
+            "bad_incident": (1.6, 1.7, 2.2, 2.0),
+        }
+    )
 
     def _derive_5xx_rates(
-        service: str,
-        minute_state: str,
-        ats_counts: Dict[str, int],
-        requests: int,
-    ) -> tuple[float, float, float, float]:
+        svc: np.ndarray,
+        state: np.ndarray,
+        ats_counts: np.ndarray,
+        requests: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         fam = _ats_family_shares(ats_counts, requests)
 
         infra = fam["infra"]
         miss = fam["miss_family"]
         rare = fam["rare"]
 
-        rate_500 = 0.0002
+        app_backend = svc_is_app_backend[svc]
+
+        rate_500 = np.where(app_backend, 0.0002 * 1.7, 0.0002)
         rate_502 = 0.00025
         rate_503 = 0.0002
-        rate_504 = 0.0002
-
-        if service == "app_backend":
-            rate_500 *= 1.7
-            rate_504 *= 1.4
+        rate_504 = np.where(app_backend, 0.0002 * 1.4, 0.0002)
 
-        rate_500 += 0.05 * infra + 0.01 * rare
-        rate_502 += 0.09 * infra + 0.012 * rare
-        rate_503 += 0.05 * miss + 0.10 * infra + 0.012 * rare
-        rate_504 += 0.14 * infra + 0.008 * rare
+        rate_500 = rate_500 + 0.05 * infra + 0.01 * rare
+        rate_502 = rate_502 + 0.09 * infra + 0.012 * rare
+        rate_503 = rate_503 + 0.05 * miss + 0.10 * infra + 0.012 * rare
+        rate_504 = rate_504 + 0.14 * infra + 0.008 * rare
 
-        state_mult = {
-            "healthy": (1.0, 1.0, 1.0, 1.0),
-            "cache_pressure": (1.0, 1.1, 1.25, 1.1),
-            "origin_slow": (1.15, 1.2, 1.65, 1.35),
-            "network_issue": (1.0, 1.25, 1.25, 1.9),
-            "bad_incident": (1.6, 1.7, 2.2, 2.0),
-        }[minute_state]
+        state_mult = STATE_5XX_MULT[state]
 
-        rate_500 *= state_mult[0]
-        rate_502 *= state_mult[1]
-        rate_503 *= state_mult[2]
-        rate_504 *= state_mult[3]
+        rate_500 *= state_mult[:, 0]
+        rate_502 *= state_mult[:, 1]
+        rate_503 *= state_mult[:, 2]
+        rate_504 *= state_mult[:, 3]
 
         return (
-            float(_clamp(rate_500, 0.0, 0.20)),
-            float(_clamp(rate_502, 0.0, 0.20)),
-            float(_clamp(rate_503, 0.0, 0.20)),
-            float(_clamp(rate_504, 0.0, 0.20)),
+            np.clip(rate_500, 0.0, 0.20),
+            np.clip(rate_502, 0.0, 0.20),
+            np.clip(rate_503, 0.0, 0.20),
+            np.clip(rate_504, 0.0, 0.20),
         )
 
-    def _derive_crc_errors(
-        bytes_sent: int,
-        ats_counts: Dict[str, int],
-        requests: int,
-        minute_state: str,
-    ) -> int:
-        fam = _ats_family_shares(ats_counts, requests)
-        mb = bytes_sent / 1e6
-
-        state_factor = {
+    STATE_CRC_FACTOR = _state_table(
+        {
             "healthy": 1.00,
             "cache_pressure": 1.08,
             "origin_slow": 1.16,
             "network_issue": 1.55,
             "bad_incident": 1.90,
-        }[minute_state]
+        }
+    )
+
+    def _derive_crc_lambda(
+        bytes_sent: np.ndarray,
+        ats_counts: np.ndarray,
+        requests: np.ndarray,
+        state: np.ndarray,
+    ) -> np.ndarray:
+        fam = _ats_family_shares(ats_counts, requests)
+        mb = bytes_sent / 1e6
 
         lam = (
             mb * 0.0013
-            * state_factor
+            * STATE_CRC_FACTOR[state]
             * (
                 1.0
                 + 3.2 * fam["infra"]
@@ -935,253 +1046,367 @@ def generate_minute_logs(
                 + 0.8 * fam["rare"]
             )
         )
-        return int(rng.poisson(lam=max(0.0, lam)))
+        return np.maximum(0.0, lam)
 
-    rows = []
+    STATE_4XX_MULT = _state_table(
+        {
+            "healthy": 1.00,
+            "cache_pressure": 1.00,
+            "origin_slow": 1.00,
+            "network_issue": 1.20,
+            "bad_incident": 1.35,
+        }
+    )
+    svc_4xx_mult = _lookup_array(services, DEFAULT_SERVICES, SERVICE_4XX_MULT, 1.0)
+    ct_4xx_mult = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_4XX_MULT, 1.0)
+    ct_3xx_mult = _lookup_array(content_types, DEFAULT_CONTENT_TYPES, CONTENT_TYPE_3XX_MULT, 1.0)
+
+    # -----------------------------
+    # Incidents (resolved once: minute window + category-code filters)
+    # -----------------------------
+    def _incident_latency(cols: Dict[str, np.ndarray], applies: np.ndarray, inten: float) -> None:
+        cols["p50"][applies] *= 1.3 * inten
+        cols["p95"][applies] *= 1.8 * inten
+        cols["p99"][applies] *= 2.2 * inten
+
+    def _incident_cache_collapse(cols: Dict[str, np.ndarray], applies: np.ndarray, inten: float) -> None:
+        cols["cache_hit"][applies] = np.clip(cols["cache_hit"][applies] - (0.35 * inten), 0.01, 0.99)
+        cols["p95"][applies] *= 1.4 * inten
+        cols["p99"][applies] *= 1.7 * inten
+
+    def _incident_origin_overload(cols: Dict[str, np.ndarray], applies: np.ndarray, inten: float) -> None:
+        extra = cols["requests"][applies] * _clamp(0.02 * inten, 0.0, 0.4)
+        cols["status_503"][applies] += extra.astype(np.int64)
+        cols["p95"][applies] *= 1.5 * inten
+        cols["p99"][applies] *= 1.9 * inten
+
+    def _incident_timeouts(cols: Dict[str, np.ndarray], applies: np.ndarray, inten: float) -> None:
+        extra = cols["requests"][applies] * _clamp(0.015 * inten, 0.0, 0.35)
+        cols["status_504"][applies] += extra.astype(np.int64)
+        cols["p99"][applies] *= 2.4 * inten
+
+    def _incident_crc_spike(cols: Dict[str, np.ndarray], applies: np.ndarray, inten: float) -> None:
+        extra = np.maximum(0.0, (cols["bytes_sent"][applies] / 1e6) * (0.25 * inten))
+        cols["crc_errors"][applies] += extra.astype(np.int64)
+
+    INCIDENT_EFFECTS = {
+        "latency": _incident_latency,
+        "cache_collapse": _incident_cache_collapse,
+        "origin_overload": _incident_origin_overload,
+        "timeouts": _incident_timeouts,
+        "crc_spike": _incident_crc_spike,
+    }
+
+    minute_offsets = np.arange(minutes)
+    resolved_incidents = []
+    for inc in incidents:
+        effect = INCIDENT_EFFECTS.get(inc.kind)
+        if effect is None:
+            continue
+
+        start_off = (inc.start_ts - ts0).total_seconds() / 60
+        end_off = (inc.end_ts - ts0).total_seconds() / 60
+        window = (minute_offsets >= start_off) & (minute_offsets < end_off)
+        if not window.any():
+            continue
+
+        filters = [
+            (dim, code)
+            for dim, code in (
+                ("partner", _filter_code(partners, inc.partner)),
+                ("service", _filter_code(services, inc.service)),
+                ("region", _filter_code(regions, inc.region)),
+                ("pop", _filter_code(pops, inc.pop)),
+                ("content_type", _filter_code(content_types, inc.content_type)),
+            )
+            if code != -1
+        ]
+        resolved_incidents.append((window, filters, effect, max(0.1, inc.intensity)))
+
+    k = _slices_per_minute(density)
+
+    ts_minutes = ts_arr.astype("datetime64[us]")
 
     for m in range(minutes):
-        ts = ts0 + timedelta(minutes=m)
+        # Distinct slices per minute (no duplicate ts+slice rows); the order within the
+        # minute is irrelevant, so skip the final shuffle.
+        idxs = rng.choice(pool_size, size=k, replace=False, shuffle=False)
+        svc = pool_service[idxs]
+        ct = pool_ctype[idxs]
+        rg = pool_region[idxs]
+        state = service_state_timelines[svc, m]
+
+        mult = traffic_multiplier(m, svc, ct) * STATE_REQUEST_MULT[state]
+        lam = np.maximum(0.0, base_rps_arr[svc] * 60 * ctype_mult_arr[ct] * region_mult_arr[rg] * mult)
+        requests = rng.poisson(lam=lam)
+
+        active = requests > 0
+        if not active.any():
+            continue
+        idxs = idxs[active]
+        svc = svc[active]
+        ct = ct[active]
+        rg = rg[active]
+        state = state[active]
+        requests = requests[active]
+        prof = ct_profile[ct]
+        n = len(idxs)
+
+        dims = {
+            "partner": pool_partner[idxs],
+            "service": svc,
+            "region": rg,
+            "pop": pool_pop[idxs],
+            "host": pool_host[idxs],
+            "content_type": ct,
+            "ua_family": pool_ua[idxs],
+        }
 
-        k = max(50, int(len(slice_pool) * density))
-        idxs = rng.choice(len(slice_pool), size=k, replace=False)
+        # All per-slice Gaussian noise for this minute in one draw, rows in the order the
+        # separate normal/lognormal calls used: cache, log p50, p95 mult, p99 mult, bytes.
+        z_cache, z_p50, z_p95, z_p99, z_bytes = rng.standard_normal((5, n))
 
-        for idx in idxs:
-            partner, service, region, pop, host, ctype, ua_family = slice_pool[idx]
-            minute_state = service_state_timelines[service][m]
+        pre_ats_cache_hit = np.clip(
+            (base_cache_arr[ct] + 0.05 * z_cache) + STATE_CACHE_DELTA[state], 0.05, 0.99
+        )
 
-            mult = traffic_multiplier(ts, service, ctype) * _state_request_multiplier(minute_state)
+        p50 = np.maximum(5.0, np.exp(np.log(base_p50_arr[ct] + svc_add_arr[svc]) + 0.25 * z_p50))
+        p95 = p50 * (2.2 + 0.25 * z_p95)
+        p99 = p50 * (3.4 + 0.35 * z_p99)
+
+        latency_mult = STATE_LATENCY_MULT[state]
+        p50 *= latency_mult[:, 0]
+        p95 *= latency_mult[:, 1]
+        p99 *= latency_mult[:, 2]
+
+        avg_bytes = avg_bytes_arr[ct]
+        bytes_sent = (requests * np.maximum(2000.0, avg_bytes + avg_bytes * 0.15 * z_bytes)).astype(np.int64)
+
+        ats_counts = _sample_ats_counts(
+            requests=requests,
+            state=state,
+            prof=prof,
+            svc=svc,
+            ct=ct,
+            cache_hit=pre_ats_cache_hit,
+        )
 
-            base_rps = {
-                "live": 90,
-                "vod": 60,
-                "dvr": 25,
-                "eas": 10,
-                "live_ott": 40,
-                "app_backend": 35,
-            }.get(service, 30)
+        cache_hit = _derive_cache_hit_rate(
+            base_cache_hit=pre_ats_cache_hit,
+            ats_counts=ats_counts,
+            requests=requests,
+            state=state,
+        )
 
-            ctype_mult = {"manifest": 0.35, "segment": 1.0, "api": 0.55}.get(ctype, 0.6)
-            region_mult = 1.0 + (0.15 if region.startswith("us") else 0.05)
+        p50, p95, p99 = _apply_latency_pressure(
+            p50=p50,
+            p95=p95,
+            p99=p99,
+            prof=prof,
+            ats_counts=ats_counts,
+            requests=requests,
+            state=state,
+        )
 
-            lam = max(0.0, base_rps * 60 * ctype_mult * region_mult * mult)
-            requests = int(rng.poisson(lam=lam))
-            if requests == 0:
-                continue
+        rate_500, rate_502, rate_503, rate_504 = _derive_5xx_rates(
+            svc=svc,
+            state=state,
+            ats_counts=ats_counts,
+            requests=requests,
+        )
 
-            base_cache = {"manifest": 0.82, "segment": 0.90, "api": 0.55}.get(ctype, 0.75)
-            pre_ats_cache_hit = float(
-                _clamp(rng.normal(base_cache, 0.05) + _state_cache_delta(minute_state), 0.05, 0.99)
-            )
+        crc_lam = _derive_crc_lambda(
+            bytes_sent=bytes_sent,
+            ats_counts=ats_counts,
+            requests=requests,
+            state=state,
+        )
 
-            base_p50 = {"manifest": 120, "segment": 80, "api": 160}.get(ctype, 110)
-            svc_add = {
-                "live": 15,
-                "vod": 10,
-                "dvr": 20,
-                "eas": 25,
-                "live_ott": 18,
-                "app_backend": 30,
-            }.get(service, 15)
-
-            p50 = max(5.0, rng.lognormal(mean=math.log(base_p50 + svc_add), sigma=0.25))
-            p95 = p50 * float(rng.normal(2.2, 0.25))
-            p99 = p50 * float(rng.normal(3.4, 0.35))
-
-            lp50, lp95, lp99 = _state_latency_multipliers(minute_state)
-            p50 *= lp50
-            p95 *= lp95
-            p99 *= lp99
-
-            avg_bytes = {"manifest": 18_000, "segment": 900_000, "api": 45_000}.get(ctype, 120_000)
-            bytes_sent = int(requests * max(2000.0, rng.normal(avg_bytes, avg_bytes * 0.15)))
-
-            ats_counts = _sample_ats_counts(
-                requests=requests,
-                state=minute_state,
-                ctype=ctype,
-                service=service,
-                cache_hit=pre_ats_cache_hit,
-            )
+        # One multinomial over [500, 502, 503, 504, non-5xx] (each rate <= 0.20, so the
+        # non-5xx share stays >= 0.20).
+        p_5xx = np.column_stack((rate_500, rate_502, rate_503, rate_504, np.empty_like(rate_500)))
+        p_5xx[:, 4] = np.maximum(0.0, 1.0 - p_5xx[:, :4].sum(axis=1))
+        counts_5xx = rng.multinomial(requests, p_5xx)
+        status_500, status_502, status_503, status_504 = counts_5xx[:, :4].T
+
+        http_5xx_tmp = status_500 + status_502 + status_503 + status_504
+        max_5xx_allowed = (requests * 0.40).astype(np.int64)
+        over = (http_5xx_tmp > max_5xx_allowed) & (http_5xx_tmp > 0)
+        if over.any():
+            scale = np.where(over, max_5xx_allowed / np.maximum(http_5xx_tmp, 1), 1.0)
+            status_500 = np.where(over, np.round(status_500 * scale), status_500).astype(np.int64)
+            status_502 = np.where(over, np.round(status_502 * scale), status_502).astype(np.int64)
+            status_503 = np.where(over, np.round(status_503 * scale), status_503).astype(np.int64)
+            status_504 = np.where(over, np.round(status_504 * scale), status_504).astype(np.int64)
+
+        crc_errors = rng.poisson(lam=crc_lam)
+
+        if resolved_incidents:
+            incident_cols = {
+                "requests": requests,
+                "bytes_sent": bytes_sent,
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "cache_hit": cache_hit,
+                "status_503": status_503,
+                "status_504": status_504,
+                "crc_errors": crc_errors,
+            }
+            for window, filters, effect, inten in resolved_incidents:
+                if not window[m]:
+                    continue
+                applies = np.ones(n, dtype=bool)
+                for dim, code in filters:
+                    applies &= dims[dim] == code
+                if applies.any():
+                    effect(incident_cols, applies, inten)
+
+        p95 = np.maximum(p95, p50)
+        p99 = np.maximum(p99, p95)
+
+        http_5xx = status_500 + status_502 + status_503 + status_504
+        remaining = np.maximum(0, requests - http_5xx)
+
+        # 4xx first, then 3xx out of what is left, 2xx = rest: one multinomial with
+        # p = [p4, (1 - p4) * p3, (1 - p4) * (1 - p3)].
+        p4 = np.minimum(0.004 * svc_4xx_mult[svc] * ct_4xx_mult[ct] * STATE_4XX_MULT[state], 0.25)
+        p3 = np.minimum(0.02 * ct_3xx_mult[ct], 0.40)
+        p_non5xx = np.column_stack((p4, (1.0 - p4) * p3, (1.0 - p4) * (1.0 - p3)))
+        http_4xx, http_3xx, http_2xx = rng.multinomial(remaining, p_non5xx).T
+
+        segment = prof == CT_SEGMENT
+        major_2xx = rng.binomial(http_2xx, np.where(segment, 0.90, 0.85))
+        status_206 = np.where(segment, major_2xx, http_2xx - major_2xx)
+        status_200 = http_2xx - status_206
+
+        status_304 = http_3xx
+
+        status_404 = rng.binomial(http_4xx, 0.50)
+        rem4 = http_4xx - status_404
+        status_403 = rng.binomial(rem4, 0.30)
+        status_429 = rem4 - status_403
+
+        metrics = {
+            "requests": requests,
+            "bytes_sent": bytes_sent,
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "p99_ms": p99,
+            "cache_hit_rate": cache_hit,
+            "http_2xx_count": http_2xx,
+            "http_3xx_count": http_3xx,
+            "http_4xx_count": http_4xx,
+            "http_5xx_count": http_5xx,
+            "status_200": status_200,
+            "status_206": status_206,
+            "status_304": status_304,
+            "status_403": status_403,
+            "status_404": status_404,
+            "status_429": status_429,
+            "status_500": status_500,
+            "status_502": status_502,
+            "status_503": status_503,
+            "status_504": status_504,
+            "crc_errors": crc_errors,
+        }
 
-            cache_hit = _derive_cache_hit_rate(
-                base_cache_hit=pre_ats_cache_hit,
-                ats_counts=ats_counts,
-                requests=requests,
-                minute_state=minute_state,
-            )
+        yield {
+            "seed": np.full(n, seed, dtype=np.int64),
+            "ts": np.full(n, ts_minutes[m]),
+            **dims,
+            **{col: np.asarray(values, dtype=METRIC_DTYPES[col]) for col, values in metrics.items()},
+            **{col: ats_counts[:, i].astype(ATS_DTYPE, copy=False) for i, col in enumerate(ATS_COLUMNS)},
+        }
 
-            p50, p95, p99 = _apply_latency_pressure(
-                p50=p50,
-                p95=p95,
-                p99=p99,
-                ctype=ctype,
-                ats_counts=ats_counts,
-                requests=requests,
-                minute_state=minute_state,
-            )
 
-            rate_500, rate_502, rate_503, rate_504 = _derive_5xx_rates(
-                service=service,
-                minute_state=minute_state,
-                ats_counts=ats_counts,
-                requests=requests,
-            )
+def generate_minute_logs(
+    start_ts_utc: datetime,
+    minutes: int,
+    n_partners: int = 6,
+    n_pops: int = 20,
+    n_hosts: int = 120,
+    services: List[str] | None = None,
+    regions: List[str] | None = None,
+    content_types: List[str] | None = None,
+    ua_families: List[str] | None = None,
+    seed: int = 7,
+    incidents: List[Incident] | None = None,
+    density: float = 0.10,
+    pool_seed: int | None = None,
+) -> pd.DataFrame:
+    """
+    Generate minute-level aggregated CDN-like telemetry.
+    Each row = 1 minute × 1 slice.
+    Returns a DataFrame (no file I/O here).
 
-            status_500 = int(rng.binomial(requests, rate_500))
-            status_502 = int(rng.binomial(requests, rate_502))
-            status_503 = int(rng.binomial(requests, rate_503))
-            status_504 = int(rng.binomial(requests, rate_504))
-
-            http_5xx_tmp = status_500 + status_502 + status_503 + status_504
-            max_5xx_allowed = int(requests * 0.40)
-            if http_5xx_tmp > max_5xx_allowed and http_5xx_tmp > 0:
-                scale = max_5xx_allowed / http_5xx_tmp
-                status_500 = int(round(status_500 * scale))
-                status_502 = int(round(status_502 * scale))
-                status_503 = int(round(status_503 * scale))
-                status_504 = int(round(status_504 * scale))
-
-            crc_errors = _derive_crc_errors(
-                bytes_sent=bytes_sent,
-                ats_counts=ats_counts,
-                requests=requests,
-                minute_state=minute_state,
-            )
+    Guarantees:
+    - http_2xx + http_3xx + http_4xx + http_5xx == requests
+    - status_200 + status_206 == http_2xx
+    - status_304 == http_3xx
+    - status_403 + status_404 + status_429 == http_4xx
+    - status_500 + status_502 + status_503 + status_504 == http_5xx
 
-            for inc in incidents:
-                if not (inc.start_ts <= ts < inc.end_ts):
-                    continue
-                if not (
-                    _matches(partner, inc.partner)
-                    and _matches(service, inc.service)
-                    and _matches(region, inc.region)
-                    and _matches(pop, inc.pop)
-                    and _matches(ctype, inc.content_type)
-                ):
-                    continue
+    Phase 7 scope:
+    - keep realistic traffic/state/ATS/latency/correlation logic
+    - update aggregation support for ATS columns
 
-                inten = max(0.1, inc.intensity)
-
-                if inc.kind == "latency":
-                    p50 *= 1.3 * inten
-                    p95 *= 1.8 * inten
-                    p99 *= 2.2 * inten
-                elif inc.kind == "cache_collapse":
-                    cache_hit = _clamp(cache_hit - (0.35 * inten), 0.01, 0.99)
-                    p95 *= 1.4 * inten
-                    p99 *= 1.7 * inten
-                elif inc.kind == "origin_overload":
-                    status_503 += int(requests * _clamp(0.02 * inten, 0.0, 0.4))
-                    p95 *= 1.5 * inten
-                    p99 *= 1.9 * inten
-                elif inc.kind == "timeouts":
-                    status_504 += int(requests * _clamp(0.015 * inten, 0.0, 0.35))
-                    p99 *= 2.4 * inten
-                elif inc.kind == "crc_spike":
-                    crc_errors += int(max(0.0, (bytes_sent / 1e6) * (0.25 * inten)))
-
-            p95 = max(p95, p50)
-            p99 = max(p99, p95)
-
-            http_5xx = status_500 + status_502 + status_503 + status_504
-            remaining = max(0, requests - http_5xx)
-
-            base_4xx = 0.004
-            if service == "app_backend":
-                base_4xx *= 2.0
-            if ctype == "api":
-                base_4xx *= 1.5
-
-            if minute_state == "network_issue":
-                base_4xx *= 1.20
-            elif minute_state == "bad_incident":
-                base_4xx *= 1.35
-
-            http_4xx = int(rng.binomial(remaining, min(base_4xx, 0.25)))
-            remaining -= http_4xx
-
-            base_3xx = 0.02
-            if ctype == "manifest":
-                base_3xx *= 1.3
-            if ctype == "api":
-                base_3xx *= 1.1
-
-            http_3xx = int(rng.binomial(remaining, min(base_3xx, 0.40)))
-            remaining -= http_3xx
-
-            http_2xx = max(0, remaining)
-
-            if (http_2xx + http_3xx + http_4xx + http_5xx) != requests:
-                http_2xx = max(0, requests - (http_3xx + http_4xx + http_5xx))
-
-            if http_2xx > 0:
-                if ctype == "segment":
-                    status_206 = int(rng.binomial(http_2xx, 0.90))
-                    status_200 = http_2xx - status_206
-                else:
-                    status_200 = int(rng.binomial(http_2xx, 0.85))
-                    status_206 = http_2xx - status_200
-            else:
-                status_200 = 0
-                status_206 = 0
-
-            status_304 = http_3xx
-
-            if http_4xx > 0:
-                status_404 = int(rng.binomial(http_4xx, 0.50))
-                rem4 = http_4xx - status_404
-                status_403 = int(rng.binomial(rem4, 0.30))
-                rem4 -= status_403
-                status_429 = rem4
-            else:
-                status_403 = 0
-                status_404 = 0
-                status_429 = 0
-
-            if (status_200 + status_206) != http_2xx:
-                status_200 = max(0, http_2xx - status_206)
-            if status_304 != http_3xx:
-                status_304 = http_3xx
-            if (status_403 + status_404 + status_429) != http_4xx:
-                status_429 = max(0, http_4xx - (status_403 + status_404))
-
-            rows.append(
-                {
-                    "seed": int(seed),
-                    "ts": ts,
-                    "partner": partner,
-                    "service": service,
-                    "region": region,
-                    "pop": pop,
-                    "host": host,
-                    "content_type": ctype,
-                    "ua_family": ua_family,
-                    "requests": int(requests),
-                    "bytes_sent": int(bytes_sent),
-                    "p50_ms": float(p50),
-                    "p95_ms": float(p95),
-                    "p99_ms": float(p99),
-                    "cache_hit_rate": float(cache_hit),
-                    "http_2xx_count": int(http_2xx),
-                    "http_3xx_count": int(http_3xx),
-                    "http_4xx_count": int(http_4xx),
-                    "http_5xx_count": int(http_5xx),
-                    "status_200": int(status_200),
-                    "status_206": int(status_206),
-                    "status_304": int(status_304),
-                    "status_403": int(status_403),
-                    "status_404": int(status_404),
-                    "status_429": int(status_429),
-                    "status_500": int(status_500),
-                    "status_502": int(status_502),
-                    "status_503": int(status_503),
-                    "status_504": int(status_504),
-                    "crc_errors": int(crc_errors),
-                    **ats_counts,
-                }
-            )
+    Each minute's sampled slices are generated as one vectorized batch:
+    slice dimensions are small-int category codes, and every metric is a
+    NumPy array over the batch (no per-slice Python loop). Slice dimension
+    columns are returned as pandas Categoricals over the configured labels.
+
+    pool_seed draws the slice pool from its own stream instead of `seed`, so
+    runs with different seeds (e.g. minute-range shards) share slice identities.
+    """
+    # SoA output buffers sized to the upper bound (every sampled slice active); trimmed at the end.
+    capacity = minutes * _slices_per_minute(density)
+    ts_buf = np.empty(capacity, dtype="datetime64[us]")
+    labels = dimension_labels(n_partners, n_pops, n_hosts, services, regions, content_types, ua_families)
+    dim_bufs = {col: np.empty(capacity, dtype=_code_dtype(len(labels[col]))) for col in DIMENSION_COLUMNS}
+    metric_bufs = {col: np.empty(capacity, dtype=dtype) for col, dtype in METRIC_DTYPES.items()}
+    ats_buf = np.empty((capacity, len(ATS_COLUMNS)), dtype=ATS_DTYPE, order="F")
+    write = 0
+
+    for batch in generate_minute_batches(
+        start_ts_utc,
+        minutes,
+        n_partners=n_partners,
+        n_pops=n_pops,
+        n_hosts=n_hosts,
+        services=services,
+        regions=regions,
+        content_types=content_types,
+        ua_families=ua_families,
+        seed=seed,
+        incidents=incidents,
+        density=density,
+        pool_seed=pool_seed,
+    ):
+        end = write + len(batch["ts"])
+        ts_buf[write:end] = batch["ts"]
+        for col in DIMENSION_COLUMNS:
+            dim_bufs[col][write:end] = batch[col]
+        for col, buf in metric_bufs.items():
+            buf[write:end] = batch[col]
+        for i, col in enumerate(ATS_COLUMNS):
+            ats_buf[write:end, i] = batch[col]
+        write = end
+
+    if write == 0:
+        return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df["ts"] = pd.to_datetime(df["ts"], utc=True)
+    df = pd.DataFrame(
+        {
+            "seed": np.full(write, seed, dtype=np.int64),
+            # Buffer holds naive UTC minutes; attaching the tz is metadata-only (no parse).
+            "ts": pd.DatetimeIndex(ts_buf[:write], tz="UTC"),
+            **{
+                col: pd.Categorical.from_codes(dim_bufs[col][:write], categories=labels[col])
+                for col in DIMENSION_COLUMNS
+            },
+            **{col: buf[:write] for col, buf in metric_bufs.items()},
+            **{col: ats_buf[:write, i] for i, col in enumerate(ATS_COLUMNS)},
+        }
+    )
     return df
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 # ------------------------------------------------------------
 # Canonical allowed values (additive only)
 # ------------------------------------------------------------
@@ -13,11 +15,39 @@ DEFAULT_REGIONS = [
 ]
 DEFAULT_UA_FAMILIES = ["stb", "mobile", "web", "smart_tv", "console"]
 
+
+# ------------------------------------------------------------
+# Canonical per-label model tables
+# One entry per label, aligned with DEFAULT_SERVICES / DEFAULT_CONTENT_TYPES,
+# so a category code indexes them directly. Read-only (shared module state).
+# ------------------------------------------------------------
+def _frozen(values: list[float]) -> np.ndarray:
+    arr = np.array(values, dtype=float)
+    arr.setflags(write=False)
+    return arr
+
+
+# live, vod, dvr, eas, live_ott, app_backend
+SERVICE_BASE_RPS = _frozen([90, 60, 25, 10, 40, 35])
+SERVICE_P50_ADD_MS = _frozen([15, 10, 20, 25, 18, 30])
+SERVICE_EVENT_SENSITIVITY = _frozen([1.35, 1.05, 1.00, 0.95, 1.28, 0.88])
+SERVICE_4XX_MULT = _frozen([1.0, 1.0, 1.0, 1.0, 1.0, 2.0])
+
+# manifest, segment, api
+CONTENT_TYPE_RPS_MULT = _frozen([0.35, 1.0, 0.55])
+CONTENT_TYPE_BASE_CACHE_HIT = _frozen([0.82, 0.90, 0.55])
+CONTENT_TYPE_BASE_P50_MS = _frozen([120, 80, 160])
+CONTENT_TYPE_AVG_BYTES = _frozen([18_000, 900_000, 45_000])
+CONTENT_TYPE_EVENT_SENSITIVITY = _frozen([1.08, 1.25, 0.82])
+CONTENT_TYPE_4XX_MULT = _frozen([1.0, 1.0, 1.5])
+CONTENT_TYPE_3XX_MULT = _frozen([1.3, 1.0, 1.1])
+
 # ------------------------------------------------------------
 # Stable column order for raw_minute output
 # Rule: never rename; never reorder existing; only ADD new columns.
+# A tuple, so callers cannot mutate the shared contract.
 # ------------------------------------------------------------
-RAW_MINUTE_COLUMNS = [
+RAW_MINUTE_COLUMNS = (
     # Provenance (metadata)
     "seed",
 
@@ -85,7 +115,7 @@ RAW_MINUTE_COLUMNS = [
     "ats_err_read_timeout_count",
     "ats_err_proxy_denied_count",
     "ats_err_unknown_count",
-]
+)
 
 # ------------------------------------------------------------
 # 15m aggregated output schema